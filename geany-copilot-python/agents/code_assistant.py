@@ -7,7 +7,7 @@ and optimization features with agent-based intelligence.
 
 import logging
 import re
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 from dataclasses import dataclass
 from enum import Enum
 
@@ -109,21 +109,27 @@ class CodeAssistant:
             raise
     
     def request_assistance(self, request: str, 
-                          task_type: Optional[CodeTaskType] = None) -> APIResponse:
+                          task_type: Optional[CodeTaskType] = None,
+                          conversation_id: Optional[str] = None,
+                          context: Optional[str] = None) -> APIResponse:
         """
         Request code assistance.
         
         Args:
             request: User's request for assistance
             task_type: Type of task (optional, will be inferred if not provided)
+            conversation_id: Conversation to use instead of the current session
+            context: Context to send instead of reading it from the editor
             
         Returns:
             APIResponse with the assistant's response
         """
         try:
-            # Ensure we have an active conversation
-            if not self.current_conversation_id:
-                self.start_assistance_session()
+            if conversation_id is None:
+                # Ensure we have an active conversation
+                if not self.current_conversation_id:
+                    self.start_assistance_session()
+                conversation_id = self.current_conversation_id
             
             # Infer task type if not provided
             if task_type is None:
@@ -133,11 +139,11 @@ class CodeAssistant:
             enhanced_request = self._enhance_request(request, task_type)
             
             # Get updated context
-            updated_context = self.get_context()
+            updated_context = self.get_context() if context is None else context
             
             # Continue conversation
             response = self.ai_agent.continue_conversation(
-                self.current_conversation_id,
+                conversation_id,
                 enhanced_request,
                 updated_context
             )
@@ -150,21 +156,29 @@ class CodeAssistant:
             return APIResponse(success=False, content="", error=error_msg)
     
     def request_streaming_assistance(self, request: str,
-                                   task_type: Optional[CodeTaskType] = None) -> APIResponse:
+                                   task_type: Optional[CodeTaskType] = None,
+                                   on_chunk: Optional[Callable[[str], None]] = None,
+                                   conversation_id: Optional[str] = None,
+                                   context: Optional[str] = None) -> APIResponse:
         """
         Request streaming code assistance.
         
         Args:
             request: User's request for assistance
             task_type: Type of task (optional, will be inferred if not provided)
+            on_chunk: Callback receiving each content chunk as it arrives
+            conversation_id: Conversation to use instead of the current session
+            context: Context to send instead of reading it from the editor
             
         Returns:
             APIResponse with streaming content
         """
         try:
-            # Ensure we have an active conversation
-            if not self.current_conversation_id:
-                self.start_assistance_session()
+            if conversation_id is None:
+                # Ensure we have an active conversation
+                if not self.current_conversation_id:
+                    self.start_assistance_session()
+                conversation_id = self.current_conversation_id
             
             # Infer task type if not provided
             if task_type is None:
@@ -174,14 +188,15 @@ class CodeAssistant:
             enhanced_request = self._enhance_request(request, task_type)
             
             # Get updated context
-            updated_context = self.get_context()
+            updated_context = self.get_context() if context is None else context
             
             # Continue conversation with streaming
             response = self.ai_agent.continue_conversation(
-                self.current_conversation_id,
+                conversation_id,
                 enhanced_request,
                 updated_context,
-                stream=True
+                stream=True,
+                on_chunk=on_chunk
             )
             
             return response
@@ -119,21 +119,27 @@ class CopywriterAssistant:
             raise
     
     def request_assistance(self, request: str, 
-                          task_type: Optional[WritingTaskType] = None) -> APIResponse:
+                          task_type: Optional[WritingTaskType] = None,
+                          conversation_id: Optional[str] = None,
+                          context: Optional[str] = None) -> APIResponse:
         """
         Request writing assistance.
         
         Args:
             request: User's request for assistance
             task_type: Type of task (optional, will be inferred if not provided)
+            conversation_id: Conversation to use instead of the current session
+            context: Context to send instead of reading it from the editor
             
         Returns:
             APIResponse with the assistant's response
         """
         try:
-            # Ensure we have an active conversation
-            if not self.current_conversation_id:
-                raise ValueError("No active writing session. Start a session first.")
+            if conversation_id is None:
+                # Ensure we have an active conversation
+                if not self.current_conversation_id:
+                    raise ValueError("No active writing session. Start a session first.")
+                conversation_id = self.current_conversation_id
             
             # Infer task type if not provided
             if task_type is None:
@@ -143,11 +149,11 @@ class CopywriterAssistant:
             enhanced_request = self._enhance_request(request, task_type)
             
             # Get updated context
-            updated_context = self.get_context()
+            updated_context = self.get_context() if context is None else context
             
             # Continue conversation
             response = self.ai_agent.continue_conversation(
-                self.current_conversation_id,
+                conversation_id,
                 enhanced_request,
                 updated_context
             )
@@ -5,6 +5,7 @@ This module provides the intelligent agent system with context analysis,
 multi-turn conversations, and decision-making capabilities.
 """
 
+import itertools
 import logging
 import time
 from typing import List, Dict, Any, Optional, Callable
@@ -155,18 +156,19 @@ class AIAgent:
     conversations, context analysis, and intelligent decision-making.
     """
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, session=None):
         """
         Initialize the AI agent.
         
         Args:
             config_manager: Configuration manager instance
+            session: Optional requests session shared for API calls
         """
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
         
         # Initialize components
-        self.api_client = APIClient(config_manager)
+        self.api_client = APIClient(config_manager, session=session)
         self.context_analyzer = ContextAnalyzer()
 
         # Performance management
@@ -183,6 +185,8 @@ class AIAgent:
         # Conversation management
         self.conversations: Dict[str, Conversation] = {}
         self.active_conversation: Optional[str] = None
+        # Keeps IDs unique when several conversations start in one second
+        self._conversation_seq = itertools.count(1)
 
         # Agent state
         self.is_busy = False
@@ -205,7 +209,7 @@ class AIAgent:
         Returns:
             Conversation ID
         """
-        conversation_id = f"{agent_type}_{int(time.time())}"
+        conversation_id = f"{agent_type}_{int(time.time())}_{next(self._conversation_seq)}"
         
         conversation = Conversation(
             id=conversation_id,
@@ -230,7 +234,8 @@ class AIAgent:
     def continue_conversation(self, conversation_id: str,
                             user_message: str,
                             updated_context: Optional[str] = None,
-                            stream: bool = False) -> APIResponse:
+                            stream: bool = False,
+                            on_chunk: Optional[Callable[[str], None]] = None) -> APIResponse:
         """
         Continue an existing conversation.
         
@@ -239,6 +244,7 @@ class AIAgent:
             user_message: User's message
             updated_context: Updated context information
             stream: Whether to stream the response
+            on_chunk: Per-call chunk callback, used instead of on_response_chunk
             
         Returns:
             APIResponse object
@@ -309,7 +315,7 @@ class AIAgent:
 
             # Get response
             if stream:
-                return self._handle_streaming_response(conversation, user_message, messages)
+                return self._handle_streaming_response(conversation, user_message, messages, on_chunk)
             else:
                 return self._handle_single_response(conversation, user_message, messages, cache_key)
                 
@@ -383,9 +389,11 @@ class AIAgent:
     
     def _handle_streaming_response(self, conversation: Conversation,
                                   user_message: str,
-                                  messages: List[ChatMessage]) -> APIResponse:
+                                  messages: List[ChatMessage],
+                                  on_chunk: Optional[Callable[[str], None]] = None) -> APIResponse:
         """Handle a streaming response."""
         conversation.state = ConversationState.RESPONDING
+        chunk_callback = on_chunk or self.on_response_chunk
         
         full_response = ""
         last_response = None
@@ -394,8 +402,8 @@ class AIAgent:
             for chunk_response in self.api_client.chat_completion_stream(messages):
                 if chunk_response.success:
                     full_response += chunk_response.content
-                    if self.on_response_chunk:
-                        self.on_response_chunk(chunk_response.content)
+                    if chunk_callback:
+                        chunk_callback(chunk_response.content)
                     last_response = chunk_response
                 else:
                     conversation.state = ConversationState.ERROR
@@ -8,6 +8,7 @@ OpenAI-compatible APIs with automatic failover and configuration management.
 import json
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Any, Optional, Iterator, Union
 from dataclasses import dataclass
 from enum import Enum
@@ -42,6 +43,24 @@ class APIResponse:
     reasoning: Optional[str] = None  # For reasoning models like DeepSeek-R1
 
 
+# Connections kept open per host by the shared HTTP session
+HTTP_POOL_SIZE = 32
+
+
+def create_http_session() -> requests.Session:
+    """
+    Create a requests session with a connection pool sized for concurrent use.
+
+    Reusing one session keeps TCP/TLS connections to the API endpoint open
+    across calls instead of handshaking for every request.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 class APIClient:
     """
     Flexible API client supporting multiple OpenAI-compatible providers.
@@ -50,16 +69,17 @@ class APIClient:
     for AI model interactions.
     """
     
-    def __init__(self, config_manager):
+    def __init__(self, config_manager, session: Optional[requests.Session] = None):
         """
         Initialize the API client.
 
         Args:
             config_manager: Configuration manager instance
+            session: HTTP session to share; a pooled one is created if omitted
         """
         self.config_manager = config_manager
         self.logger = logging.getLogger(__name__)
-        self.session = requests.Session()
+        self.session = session if session is not None else create_http_session()
 
         # Set default headers (timeout will be set per-request)
         self.session.headers.update({
@@ -6,11 +6,11 @@ to improve plugin performance and reduce API calls.
 """
 
 import time
+import heapq
 import hashlib
 import threading
 import logging
 from typing import Dict, Any, Optional, Callable, Tuple, List
-from dataclasses import dataclass, field
 from collections import OrderedDict
 import weakref
 import gc
@@ -19,18 +19,26 @@ import gc
 logger = logging.getLogger(__name__)
 
 
-@dataclass
 class CacheEntry:
     """A cache entry with metadata."""
-    value: Any
-    timestamp: float
-    access_count: int = 0
-    last_access: float = field(default_factory=time.time)
-    size_bytes: int = 0
+
+    # Slotted to keep per-entry overhead low in large caches
+    __slots__ = ('value', 'timestamp', 'access_count', 'last_access',
+                 'size_bytes', 'expires_at')
     
-    def __post_init__(self):
-        """Calculate approximate size of the cached value."""
-        self.size_bytes = self._calculate_size(self.value)
+    def __init__(self,
+                 value: Any,
+                 timestamp: float,
+                 access_count: int = 0,
+                 last_access: Optional[float] = None,
+                 expires_at: float = float('inf')):
+        self.value = value
+        self.timestamp = timestamp
+        self.access_count = access_count
+        self.last_access = time.time() if last_access is None else last_access
+        self.expires_at = expires_at  # time.monotonic() deadline
+        # Approximate size of the cached value
+        self.size_bytes = self._calculate_size(value)
     
     def _calculate_size(self, obj: Any) -> int:
         """Estimate the size of an object in bytes."""
@@ -50,9 +58,9 @@ class CacheEntry:
         except Exception:
             return 100  # Default estimate
     
-    def is_expired(self, ttl: float) -> bool:
-        """Check if the cache entry has expired."""
-        return time.time() - self.timestamp > ttl
+    def is_expired(self, now: float) -> bool:
+        """Check if the cache entry has expired at monotonic time now."""
+        return now >= self.expires_at
     
     def touch(self):
         """Update access information."""
@@ -102,26 +110,27 @@ class LRUCache:
     def get(self, key: str) -> Optional[Any]:
         """Get a value from the cache."""
         with self._lock:
-            if key not in self._cache:
+            entry = self._cache.get(key)
+            if entry is None:
                 self._miss_count += 1
                 return None
             
-            entry = self._cache[key]
-            
             # Check if expired
-            if entry.is_expired(self.default_ttl):
+            if entry.is_expired(time.monotonic()):
                 self._remove_entry(key)
                 return None
             
             # Move to end (most recently used)
             self._cache.move_to_end(key)
-            entry.touch()
+            now = time.time()
+            entry.access_count += 1
+            entry.last_access = now
 
             # Track access patterns for intelligent preloading
-            self._track_access_pattern(key)
+            self._track_access_pattern(key, now)
             self._hit_count += 1
 
-            logger.debug(f"Cache hit: {key} (access_count={entry.access_count})")
+            logger.debug("Cache hit: %s (access_count=%d)", key, entry.access_count)
             return entry.value
     
     def put(self, key: str, value: Any, ttl: Optional[float] = None) -> bool:
@@ -133,7 +142,8 @@ class LRUCache:
             # Create new entry
             entry = CacheEntry(
                 value=value,
-                timestamp=time.time()
+                timestamp=time.time(),
+                expires_at=time.monotonic() + ttl
             )
             
             # Check if adding this entry would exceed memory limit
@@ -142,8 +152,7 @@ class LRUCache:
                 return False
             
             # Remove existing entry if present
-            if key in self._cache:
-                self._remove_entry(key)
+            self._remove_entry(key)
             
             # Ensure we have space
             while (len(self._cache) >= self.max_size or 
@@ -156,16 +165,16 @@ class LRUCache:
             self._cache[key] = entry
             self._total_size += entry.size_bytes
             
-            logger.debug(f"Cache put: {key} ({entry.size_bytes} bytes, "
-                        f"total: {self._total_size} bytes)")
+            logger.debug("Cache put: %s (%d bytes, total: %d bytes)",
+                         key, entry.size_bytes, self._total_size)
             return True
     
     def _remove_entry(self, key: str):
         """Remove an entry from the cache."""
-        if key in self._cache:
-            entry = self._cache.pop(key)
+        entry = self._cache.pop(key, None)
+        if entry is not None:
             self._total_size -= entry.size_bytes
-            logger.debug(f"Cache remove: {key}")
+            logger.debug("Cache remove: %s", key)
     
     def _evict_lru(self) -> bool:
         """Evict the least recently used entry."""
@@ -176,7 +185,7 @@ class LRUCache:
         lru_key = next(iter(self._cache))
         self._remove_entry(lru_key)
         self._eviction_count += 1
-        logger.debug(f"Cache evict LRU: {lru_key}")
+        logger.debug("Cache evict LRU: %s", lru_key)
         return True
     
     def clear(self):
@@ -189,9 +198,10 @@ class LRUCache:
     def cleanup_expired(self):
         """Remove expired entries."""
         with self._lock:
+            now = time.monotonic()
             expired_keys = []
             for key, entry in self._cache.items():
-                if entry.is_expired(self.default_ttl):
+                if entry.is_expired(now):
                     expired_keys.append(key)
             
             for key in expired_keys:
@@ -222,17 +232,19 @@ class LRUCache:
                 'related_keys': len(self._related_keys)
             }
 
-    def _track_access_pattern(self, key: str):
+    def _track_access_pattern(self, key: str, current_time: Optional[float] = None):
         """Track access patterns for intelligent preloading."""
-        current_time = time.time()
+        if current_time is None:
+            current_time = time.time()
 
-        if key not in self._access_patterns:
-            self._access_patterns[key] = []
+        access_times = self._access_patterns.get(key)
+        if access_times is None:
+            access_times = self._access_patterns[key] = []
 
         # Keep only recent access times (last 10 accesses)
-        self._access_patterns[key].append(current_time)
-        if len(self._access_patterns[key]) > 10:
-            self._access_patterns[key] = self._access_patterns[key][-10:]
+        access_times.append(current_time)
+        if len(access_times) > 10:
+            del access_times[0]
 
     def add_related_key(self, key1: str, key2: str):
         """Mark two keys as related for intelligent invalidation."""
@@ -335,41 +347,76 @@ class RequestDebouncer:
     
     Delays execution of functions until after a specified delay has passed
     since the last time it was invoked.
+
+    All keys share one scheduler thread and a deadline heap, so debouncing
+    a call does not start a thread. Superseded calls are left in the heap
+    and skipped when their generation no longer matches the key's latest.
     """
     
     def __init__(self, delay: float = 0.5):
         self.delay = delay
-        self._timers: Dict[str, threading.Timer] = {}
-        self._lock = threading.Lock()
+        # Latest call per key: (generation, func, args, kwargs)
+        self._pending: Dict[str, Tuple[int, Callable, tuple, dict]] = {}
+        # Min-heap of (deadline, generation, key)
+        self._heap: List[Tuple[float, int, str]] = []
+        self._generation = 0
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
     
     def debounce(self, key: str, func: Callable, *args, **kwargs):
         """Debounce a function call."""
-        with self._lock:
-            # Cancel existing timer for this key
-            if key in self._timers:
-                self._timers[key].cancel()
+        with self._cond:
+            self._generation += 1
+            generation = self._generation
+            self._pending[key] = (generation, func, args, kwargs)
+            heapq.heappush(self._heap, (time.monotonic() + self.delay, generation, key))
             
-            # Create new timer
-            timer = threading.Timer(self.delay, func, args, kwargs)
-            self._timers[key] = timer
-            timer.start()
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="RequestDebouncer", daemon=True
+                )
+                self._worker.start()
+            self._cond.notify()
+        
+        logger.debug("Debounced call: %s (delay=%ss)", key, self.delay)
+    
+    def _run(self):
+        """Scheduler loop: fire each key's latest call once its deadline passes."""
+        while True:
+            with self._cond:
+                while True:
+                    if not self._heap:
+                        self._cond.wait()
+                        continue
+                    
+                    deadline, generation, key = self._heap[0]
+                    remaining = deadline - time.monotonic()
+                    if remaining > 0:
+                        self._cond.wait(remaining)
+                        continue
+                    
+                    heapq.heappop(self._heap)
+                    pending = self._pending.get(key)
+                    if pending is not None and pending[0] == generation:
+                        del self._pending[key]
+                        break
             
-            logger.debug(f"Debounced call: {key} (delay={self.delay}s)")
+            # Run outside the lock and off the scheduler thread, so a slow
+            # call (e.g. an API request) cannot hold up other keys
+            _, func, args, kwargs = pending
+            threading.Thread(target=func, args=args, kwargs=kwargs, daemon=True).start()
     
     def cancel(self, key: str):
         """Cancel a debounced call."""
-        with self._lock:
-            if key in self._timers:
-                self._timers[key].cancel()
-                del self._timers[key]
-                logger.debug(f"Cancelled debounced call: {key}")
+        with self._cond:
+            if self._pending.pop(key, None) is not None:
+                logger.debug("Cancelled debounced call: %s", key)
     
     def cancel_all(self):
         """Cancel all debounced calls."""
-        with self._lock:
-            for timer in self._timers.values():
-                timer.cancel()
-            self._timers.clear()
+        with self._cond:
+            self._pending.clear()
+            self._heap.clear()
             logger.debug("Cancelled all debounced calls")
 
 
@@ -380,8 +427,13 @@ class MemoryOptimizer:
     Provides methods to monitor and optimize memory usage.
     """
     
+    # Every Nth forced collection sweeps all generations; the rest only
+    # collect the youngest one
+    FULL_COLLECTION_INTERVAL = 10
+    
     def __init__(self):
         self._weak_refs: weakref.WeakSet = weakref.WeakSet()
+        self._collections_since_full = 0
     
     def register_object(self, obj: Any):
         """Register an object for memory monitoring."""
@@ -414,8 +466,15 @@ class MemoryOptimizer:
     
     def force_garbage_collection(self):
         """Force garbage collection."""
-        collected = gc.collect()
-        logger.debug(f"Garbage collection: collected {collected} objects")
+        self._collections_since_full += 1
+        if self._collections_since_full >= self.FULL_COLLECTION_INTERVAL:
+            self._collections_since_full = 0
+            generation = 2
+        else:
+            generation = 0
+        collected = gc.collect(generation)
+        logger.debug("Garbage collection (generation %d): collected %d objects",
+                     generation, collected)
         return collected
     
     def optimize_memory(self):
@@ -496,7 +555,7 @@ class PerformanceManager:
         key_data = str(args) + str(sorted(kwargs.items()))
         
         # Hash the key data to create a consistent key
-        return hashlib.md5(key_data.encode('utf-8')).hexdigest()
+        return hashlib.blake2b(key_data.encode('utf-8'), digest_size=16).hexdigest()
     
     def debounce_request(self, key: str, func: Callable, *args, **kwargs):
         """Debounce a request."""
@@ -557,12 +616,12 @@ class PerformanceManager:
 
         if include_context_hash and context:
             # Use a shorter hash for context to allow for similar contexts
-            context_hash = hashlib.md5(context.encode('utf-8')).hexdigest()[:8]
+            context_hash = hashlib.blake2b(context.encode('utf-8'), digest_size=4).hexdigest()
             key_components.append(context_hash)
 
         # Generate the cache key
         key_data = "|".join(key_components)
-        return hashlib.md5(key_data.encode('utf-8')).hexdigest()
+        return hashlib.blake2b(key_data.encode('utf-8'), digest_size=16).hexdigest()
 
     def cache_response_with_relations(self, key: str, response: Any,
                                     related_keys: Optional[List[str]] = None):
@@ -6,17 +6,105 @@ with support for JSON-based settings compatible with the original Lua version.
 """
 
 import os
+import copy
 import json
+import hashlib
 import logging
 import stat
-from typing import Dict, Any, Optional, List, Union
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, List, Tuple, Union
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
 from .credentials import CredentialManager
 
 
+# Process-wide cache of parsed config/prompt files, keyed by path and
+# invalidated when the file's modification time changes.
+_CONFIG_CACHE: Dict[Path, Tuple[int, Any]] = {}
+
+# Sentinel for missing values in the flattened key-path index
+_MISSING = object()
+
+
+def _freeze(node: Dict[str, Any]) -> Mapping[str, Any]:
+    """Recursively wrap a nested dictionary in read-only mapping proxies."""
+    return MappingProxyType({
+        key: _freeze(value) if isinstance(value, dict) else value
+        for key, value in node.items()
+    })
+
+
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """Serialize a dictionary to compact JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode('utf-8')
+
+
+def _load_json_bytes(data: bytes) -> Any:
+    """Parse JSON bytes into Python objects."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _is_positive_int(value: Any) -> bool:
+    """Check that a value is a positive integer."""
+    return isinstance(value, int) and value > 0
+
+
+def _is_positive_number(value: Any) -> bool:
+    """Check that a value is a positive int or float."""
+    return isinstance(value, (int, float)) and value > 0
+
+
+# Numeric validation rules as
+# (key, default, predicate, error message, warning limit, warning message).
+# A value of None (no default) is skipped; messages may use {name}.
+_CACHE_RULES = (
+    ('max_size', 100, _is_positive_int,
+     "Cache max_size must be a positive integer",
+     1000, "Cache max_size is very large - may consume excessive memory"),
+    ('max_memory_mb', 50.0, _is_positive_number,
+     "Cache max_memory_mb must be a positive number",
+     500, "Cache max_memory_mb is very large - may consume excessive memory"),
+)
+
+_AGENT_RULES = (
+    ('max_tokens', None, _is_positive_int,
+     "Agent '{name}' max_tokens must be a positive integer",
+     32000, "Agent '{name}' max_tokens is very large - may be expensive"),
+)
+
+
+# Configuration recommendations as (condition, message); each condition
+# takes (security_status, cache_config, validation_result)
+_RECOMMENDATION_RULES = (
+    # Security recommendations
+    (lambda security, cache, result: not security.get('keyring_available'),
+     "Install keyring library for enhanced API key security"),
+    (lambda security, cache, result: security.get('security_level') != 'high',
+     "Consider using environment variables or keyring for API key storage"),
+    # Performance recommendations
+    (lambda security, cache, result: cache.get('max_memory_mb', 50) < 100,
+     "Consider increasing cache memory limit for better performance"),
+    # Validation-based recommendations
+    (lambda security, cache, result: bool(result.errors),
+     "Fix configuration errors to ensure proper functionality"),
+    (lambda security, cache, result: bool(result.warnings),
+     "Review configuration warnings for optimal performance"),
+)
+
+
 class ConfigValidationLevel(Enum):
     """Configuration validation levels."""
     STRICT = "strict"
@@ -93,6 +181,19 @@ class ConfigValidator:
 
         return result
 
+    def _apply_rules(self, section: Dict[str, Any], rules: Tuple, result: ValidationResult,
+                     name: str = ""):
+        """Check a configuration section against a table of numeric rules."""
+        for key, default, predicate, error, limit, warning in rules:
+            value = section.get(key, default)
+            if value is None:
+                continue
+
+            if not predicate(value):
+                result.errors.append(error.format(name=name))
+            elif value > limit:
+                result.warnings.append(warning.format(name=name))
+
     def _validate_api_config(self, api_config: Dict[str, Any], result: ValidationResult):
         """Validate API configuration."""
         # Check primary provider
@@ -130,19 +231,7 @@ class ConfigValidator:
     def _validate_performance_config(self, perf_config: Dict[str, Any], result: ValidationResult):
         """Validate performance configuration."""
         # Validate cache settings
-        cache_config = perf_config.get('cache', {})
-
-        max_size = cache_config.get('max_size', 100)
-        if not isinstance(max_size, int) or max_size <= 0:
-            result.errors.append("Cache max_size must be a positive integer")
-        elif max_size > 1000:
-            result.warnings.append("Cache max_size is very large - may consume excessive memory")
-
-        max_memory_mb = cache_config.get('max_memory_mb', 50.0)
-        if not isinstance(max_memory_mb, (int, float)) or max_memory_mb <= 0:
-            result.errors.append("Cache max_memory_mb must be a positive number")
-        elif max_memory_mb > 500:
-            result.warnings.append("Cache max_memory_mb is very large - may consume excessive memory")
+        self._apply_rules(perf_config.get('cache', {}), _CACHE_RULES, result)
 
         # Validate timeout settings
         timeout_config = perf_config.get('timeouts', {})
@@ -150,7 +239,7 @@ class ConfigValidator:
             if timeout_name.endswith('_size') or timeout_name.endswith('_chunks'):
                 continue  # Skip non-timeout settings
 
-            if not isinstance(timeout_value, (int, float)) or timeout_value <= 0:
+            if not _is_positive_number(timeout_value):
                 result.errors.append(f"Timeout '{timeout_name}' must be a positive number")
             elif timeout_value > 300:  # 5 minutes
                 result.warnings.append(f"Timeout '{timeout_name}' is very long - may cause poor user experience")
@@ -200,12 +289,7 @@ class ConfigValidator:
                     result.warnings.append(f"Agent '{agent_type}' temperature should be between 0 and 2")
 
             # Validate max_tokens
-            max_tokens = agent_config.get('max_tokens')
-            if max_tokens is not None:
-                if not isinstance(max_tokens, int) or max_tokens <= 0:
-                    result.errors.append(f"Agent '{agent_type}' max_tokens must be a positive integer")
-                elif max_tokens > 32000:
-                    result.warnings.append(f"Agent '{agent_type}' max_tokens is very large - may be expensive")
+            self._apply_rules(agent_config, _AGENT_RULES, result, name=agent_type)
 
 
 class ConfigManager:
@@ -310,6 +394,41 @@ class ConfigManager:
             "copywriter": ""
         }
     }
+
+    # Documentation included with the exported configuration template
+    _CONFIG_DOCUMENTATION = {
+        "api": {
+            "_comment": "API configuration for different providers",
+            "primary_provider": "The default provider to use",
+            "deepseek": {
+                "_comment": "DeepSeek API configuration",
+                "base_url": "API endpoint URL",
+                "model": "Model name to use",
+                "api_key": "API key (use environment variable or keyring for security)"
+            }
+        },
+        "performance": {
+            "_comment": "Performance and caching configuration",
+            "cache": {
+                "max_size": "Maximum number of cached responses",
+                "max_memory_mb": "Maximum memory usage for cache in MB",
+                "ttl": "Time to live for cached responses in seconds"
+            }
+        }
+    }
+
+    # Exported templates only depend on the defaults, so render them once
+    _TEMPLATE_JSON_WITH_COMMENTS = json.dumps({
+        "config": DEFAULT_CONFIG,
+        "documentation": _CONFIG_DOCUMENTATION
+    }, indent=2)
+    _TEMPLATE_JSON_PLAIN = json.dumps(DEFAULT_CONFIG, indent=2)
+
+    # Serialized defaults; parsing them is a cheap, alias-free deep copy
+    _DEFAULT_CONFIG_BYTES = _dump_json_bytes(DEFAULT_CONFIG)
+
+    # Expose the defaults as a read-only template
+    DEFAULT_CONFIG = _freeze(DEFAULT_CONFIG)
     
     def __init__(self):
         """Initialize the configuration manager."""
@@ -317,6 +436,9 @@ class ConfigManager:
         self.config_dir = self._get_config_directory()
         self.config_file = self.config_dir / "config.json"
         self.prompts_dir = self.config_dir / "prompts"
+        # Digest of the plaintext API keys a migration last attempted; kept
+        # out of config.json so it is never served with the settings
+        self.migration_marker_file = self.config_dir / ".api_key_migration"
 
         # Initialize credential manager
         self.credential_manager = CredentialManager()
@@ -324,12 +446,25 @@ class ConfigManager:
         # Initialize configuration validator
         self.validator = ConfigValidator()
 
+        # Whether config_file permissions have been secured by save_config()
+        self._perms_set = False
+
         # Ensure directories exist with secure permissions
         self._create_secure_directories()
 
+        # Flattened dot-path index of leaf values, built lazily by get()
+        self._flat_cache: Optional[Dict[str, Any]] = None
+
+        # Memoized reports, valid while _config_version is unchanged
+        self._config_version = 0
+        self._health_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        self._security_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+
+        # System prompts are loaded lazily on first use
+        self._prompt_cache: Dict[str, str] = {}
+
         # Load configuration
         self.config = self._load_config()
-        self._load_prompts()
 
         # Validate configuration
         self._validate_and_fix_config()
@@ -355,44 +490,88 @@ class ConfigManager:
     def _create_secure_directories(self):
         """Create configuration directories with secure permissions."""
         try:
-            # Create config directory with restricted permissions (700 - owner only)
-            self.config_dir.mkdir(parents=True, exist_ok=True)
-            os.chmod(self.config_dir, stat.S_IRWXU)  # 700 permissions
-
-            # Create prompts directory
-            self.prompts_dir.mkdir(parents=True, exist_ok=True)
-            os.chmod(self.prompts_dir, stat.S_IRWXU)  # 700 permissions
+            # Create config and prompts directories with restricted permissions
+            # (700 - owner only). makedirs only applies the mode to newly
+            # created directories, so fix up existing ones when needed.
+            for directory in (self.config_dir, self.prompts_dir):
+                os.makedirs(directory, mode=stat.S_IRWXU, exist_ok=True)
+                if stat.S_IMODE(os.stat(directory).st_mode) != stat.S_IRWXU:
+                    os.chmod(directory, stat.S_IRWXU)
 
             self.logger.debug(f"Created secure directories: {self.config_dir}")
 
         except Exception as e:
             self.logger.warning(f"Could not set secure directory permissions: {e}")
 
-    def _migrate_api_keys_if_needed(self):
-        """Migrate API keys from config file to secure storage if needed."""
-        try:
-            # Check if we have API keys in config that should be migrated
-            api_config = self.config.get('api', {})
-            has_keys_in_config = False
+    def _plaintext_api_keys_digest(self) -> Optional[str]:
+        """
+        Get a short digest of the plaintext API keys in the config file.
+
+        Returns:
+            Hex digest of the provider/key pairs, or None if there are none
+        """
+        api_config = self.config.get('api', {})
+        entries = []
+
+        for provider, provider_config in api_config.items():
+            if provider == 'primary_provider':
+                continue
+
+            if isinstance(provider_config, dict):
+                api_key = provider_config.get('api_key')
+                if api_key and api_key != "your-api-key-here":
+                    entries.append(f"{provider}:{api_key}".encode('utf-8'))
+
+        if not entries:
+            return None
+
+        return hashlib.blake2b(b"\0".join(sorted(entries)), digest_size=8).hexdigest()
+
+    def _read_migration_marker(self) -> Optional[str]:
+        """
+        Get the digest recorded by the last API key migration attempt.
+
+        Older versions kept it in config.json; such a marker is moved to
+        migration_marker_file and dropped from the config file.
+        """
+        legacy_marker = self.config.pop('_migration_marker', None)
+        if legacy_marker is not None:
+            self._write_migration_marker(legacy_marker)
+            self.save_config()
+            return legacy_marker
 
-            for provider, provider_config in api_config.items():
-                if provider == 'primary_provider':
-                    continue
+        try:
+            return self.migration_marker_file.read_text(encoding='utf-8').strip() or None
+        except FileNotFoundError:
+            return None
 
-                if isinstance(provider_config, dict) and provider_config.get('api_key'):
-                    api_key = provider_config['api_key']
-                    if api_key and api_key != "your-api-key-here" and api_key != "":
-                        has_keys_in_config = True
-                        break
+    def _write_migration_marker(self, keys_digest: str):
+        """Record the digest of the API keys a migration attempt handled."""
+        self.migration_marker_file.write_text(keys_digest, encoding='utf-8')
+        os.chmod(self.migration_marker_file, stat.S_IRUSR | stat.S_IWUSR)
 
-            if has_keys_in_config and self.credential_manager.is_keyring_available():
+    def _migrate_api_keys_if_needed(self):
+        """Migrate API keys from config file to secure storage if needed."""
+        try:
+            # Check if we have API keys in config that should be migrated,
+            # skipping keys a previous migration attempt already handled
+            stored_digest = self._read_migration_marker()
+            keys_digest = self._plaintext_api_keys_digest()
+            if keys_digest is None or keys_digest == stored_digest:
+                return
+
+            if self.credential_manager.is_keyring_available():
                 self.logger.info("Migrating API keys from config file to secure storage...")
                 if self.credential_manager.migrate_from_config(self.config):
                     # Clear API keys from config after successful migration
                     self._clear_api_keys_from_config()
-                    self.save_config()
                     self.logger.info("API key migration completed successfully")
 
+                # Remember which keys were attempted so unchanged keys that
+                # could not be migrated are not retried on every startup
+                self._write_migration_marker(keys_digest)
+                self.save_config()
+
         except Exception as e:
             self.logger.warning(f"API key migration failed: {e}")
 
@@ -407,49 +586,116 @@ class ConfigManager:
             if isinstance(provider_config, dict) and 'api_key' in provider_config:
                 provider_config['api_key'] = ""
 
+        self._mark_config_changed()
+
+    @staticmethod
+    def clear_cache():
+        """Clear the process-wide cache of loaded config and prompt files."""
+        _CONFIG_CACHE.clear()
+
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_config = json.load(f)
+                mtime_ns = self.config_file.stat().st_mtime_ns
+                cached = _CONFIG_CACHE.get(self.config_file)
+                if cached and cached[0] == mtime_ns:
+                    self.logger.debug(f"Using cached configuration for {self.config_file}")
+                    return copy.deepcopy(cached[1])
+
+                if ORJSON_AVAILABLE:
+                    loaded_config = orjson.loads(self.config_file.read_bytes())
+                else:
+                    with open(self.config_file, 'r', encoding='utf-8') as f:
+                        loaded_config = json.load(f)
                 
                 # Merge with defaults to ensure all keys exist
-                config = self._deep_merge(self.DEFAULT_CONFIG.copy(), loaded_config)
+                config = self._deep_merge(self._get_default_config(), loaded_config)
+                _CONFIG_CACHE[self.config_file] = (mtime_ns, copy.deepcopy(config))
                 self.logger.info(f"Configuration loaded from {self.config_file}")
                 return config
             else:
                 self.logger.info("No existing configuration found, using defaults")
-                return self.DEFAULT_CONFIG.copy()
+                return self._get_default_config()
                 
         except Exception as e:
             self.logger.error(f"Error loading configuration: {e}")
-            return self.DEFAULT_CONFIG.copy()
+            return self._get_default_config()
     
+    def _get_default_config(self) -> Dict[str, Any]:
+        """Get a fresh, mutable copy of the default configuration."""
+        return _load_json_bytes(self._DEFAULT_CONFIG_BYTES)
+
+    def _get_prompt(self, prompt_type: str) -> str:
+        """Get a system prompt, loading it from its file on first use."""
+        prompt = self._prompt_cache.get(prompt_type)
+        if prompt is None:
+            prompt = self._load_prompt(prompt_type)
+            self._prompt_cache[prompt_type] = prompt
+            # Filling in the file's contents is not a settings change, so
+            # only the index is dropped, not the version or memoized reports
+            self.config.setdefault("prompts", {})[prompt_type] = prompt
+            self._flat_cache = None
+        return prompt
+
     def _load_prompts(self):
-        """Load system prompts from separate files."""
+        """Load every system prompt that has not been loaded yet."""
+        for prompt_type in self.DEFAULT_CONFIG["prompts"]:
+            if prompt_type not in self._prompt_cache:
+                self._get_prompt(prompt_type)
+
+    def _load_prompt(self, prompt_type: str) -> str:
+        """Load a system prompt from its file, writing the default if missing."""
+        default_prompts = {
+            "code_assistant": self._get_default_code_prompt,
+            "copywriter": self._get_default_copywriter_prompt
+        }
+
         try:
-            # Load code assistant prompt
-            code_prompt_file = self.prompts_dir / "code_assistant.txt"
-            if code_prompt_file.exists():
-                with open(code_prompt_file, 'r', encoding='utf-8') as f:
-                    self.config["prompts"]["code_assistant"] = f.read().strip()
-            else:
-                self.config["prompts"]["code_assistant"] = self._get_default_code_prompt()
-                self._save_prompt("code_assistant", self.config["prompts"]["code_assistant"])
-            
-            # Load copywriter prompt
-            copywriter_prompt_file = self.prompts_dir / "copywriter.txt"
-            if copywriter_prompt_file.exists():
-                with open(copywriter_prompt_file, 'r', encoding='utf-8') as f:
-                    self.config["prompts"]["copywriter"] = f.read().strip()
-            else:
-                self.config["prompts"]["copywriter"] = self._get_default_copywriter_prompt()
-                self._save_prompt("copywriter", self.config["prompts"]["copywriter"])
-                
+            prompt_file = self.prompts_dir / f"{prompt_type}.txt"
+            if prompt_file.exists():
+                return self._read_prompt_file(prompt_file)
+
+            if prompt_type in default_prompts:
+                prompt = default_prompts[prompt_type]()
+                self._save_prompt(prompt_type, prompt)
+                return prompt
+
         except Exception as e:
-            self.logger.error(f"Error loading prompts: {e}")
-    
+            self.logger.error(f"Error loading {prompt_type} prompt: {e}")
+
+        return self.config.get("prompts", {}).get(prompt_type, "")
+
+    @property
+    def code_assistant_prompt(self) -> str:
+        """System prompt for the code assistant agent."""
+        return self._get_prompt("code_assistant")
+
+    @property
+    def copywriter_prompt(self) -> str:
+        """System prompt for the copywriter agent."""
+        return self._get_prompt("copywriter")
+
+    def _read_prompt_file(self, prompt_file: Path) -> str:
+        """Read a prompt file, reusing the cached content if it is unchanged."""
+        st = prompt_file.stat()
+        mtime_ns = st.st_mtime_ns
+        cached = _CONFIG_CACHE.get(prompt_file)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+
+        content = ""
+        if st.st_size:
+            # Read the whole file in one call, skipping the text I/O wrapper
+            fd = os.open(prompt_file, os.O_RDONLY)
+            try:
+                content = os.read(fd, st.st_size).decode('utf-8').strip()
+            finally:
+                os.close(fd)
+
+        _CONFIG_CACHE[prompt_file] = (mtime_ns, content)
+        return content
+
     def _get_default_code_prompt(self) -> str:
         """Get the default code assistant system prompt."""
         return """You are an intelligent AI coding assistant integrated into the Geany IDE. Your role is to provide expert-level code analysis, suggestions, and assistance.
@@ -514,23 +760,70 @@ When reviewing text:
             self.logger.error(f"Error saving {prompt_type} prompt: {e}")
     
     def _deep_merge(self, base: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
-        """Deep merge two dictionaries."""
-        for key, value in update.items():
-            if key in base and isinstance(base[key], dict) and isinstance(value, dict):
-                base[key] = self._deep_merge(base[key], value)
-            else:
-                base[key] = value
+        """
+        Deep merge two dictionaries in place.
+
+        Uses an explicit stack of (base, update) pairs instead of recursion,
+        and skips subtrees that are already the same object.
+        """
+        stack = [(base, update)]
+        while stack:
+            base_dict, update_dict = stack.pop()
+            if update_dict is base_dict:
+                continue
+
+            for key, value in update_dict.items():
+                current = base_dict.get(key)
+                if isinstance(current, dict) and isinstance(value, dict):
+                    stack.append((current, value))
+                else:
+                    base_dict[key] = value
         return base
     
+    def _build_flat_cache(self) -> Dict[str, Any]:
+        """Build a dot-path index of all leaf (non-dict) configuration values."""
+        flat = {}
+        stack = [("", self.config)]
+        while stack:
+            prefix, node = stack.pop()
+            for key, value in node.items():
+                path = f"{prefix}{key}"
+                if isinstance(value, dict):
+                    stack.append((f"{path}.", value))
+                else:
+                    flat[path] = value
+        return flat
+
+    def _mark_config_changed(self):
+        """Invalidate indexes and memoized reports after a config mutation."""
+        self._flat_cache = None
+        self._config_version += 1
+        self._health_cache = None
+        self._security_cache = None
+
+    @property
+    def config_version(self) -> int:
+        """Counter that changes whenever the configuration is modified."""
+        return self._config_version
+
     def save_config(self):
         """Save current configuration to file with secure permissions."""
+        self._mark_config_changed()
         try:
             # Save config file
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            if ORJSON_AVAILABLE:
+                self.config_file.write_bytes(
+                    orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(self.config_file, 'w', encoding='utf-8') as f:
+                    json.dump(self.config, f, indent=2, ensure_ascii=False)
 
-            # Set secure permissions (600 - owner read/write only)
-            os.chmod(self.config_file, stat.S_IRUSR | stat.S_IWUSR)
+            # Set secure permissions (600 - owner read/write only) once;
+            # rewriting the file keeps its mode
+            if not self._perms_set:
+                os.chmod(self.config_file, stat.S_IRUSR | stat.S_IWUSR)
+                self._perms_set = True
 
             self.logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
@@ -540,6 +833,9 @@ When reviewing text:
         """
         Get a configuration value using dot notation.
         
+        Sections and lists are returned as copies, so changes to them never
+        reach the configuration or its index; use set() to change values.
+        
         Args:
             key_path: Dot-separated path to the configuration key
             default: Default value if key is not found
@@ -548,6 +844,18 @@ When reviewing text:
             The configuration value or default
         """
         try:
+            if key_path == "prompts" or key_path.startswith("prompts."):
+                # Prompts are read from their files on first use
+                self._load_prompts()
+
+            if self._flat_cache is None:
+                self._flat_cache = self._build_flat_cache()
+
+            value = self._flat_cache.get(key_path, _MISSING)
+            if value is not _MISSING:
+                return copy.deepcopy(value) if isinstance(value, list) else value
+
+            # Not a leaf value (e.g. a nested section) - walk the tree
             keys = key_path.split('.')
             value = self.config
             
@@ -557,12 +865,22 @@ When reviewing text:
                 else:
                     return default
             
-            return value
+            return copy.deepcopy(value)
             
         except Exception as e:
             self.logger.error(f"Error getting config value for {key_path}: {e}")
             return default
     
+    def get_all_settings(self) -> Dict[str, Any]:
+        """
+        Get the whole configuration.
+        
+        Returns:
+            Deep copy of the configuration, safe for callers to modify
+        """
+        self._load_prompts()
+        return copy.deepcopy(self.config)
+    
     def set(self, key_path: str, value: Any):
         """
         Set a configuration value using dot notation.
@@ -571,6 +889,7 @@ When reviewing text:
             key_path: Dot-separated path to the configuration key
             value: Value to set
         """
+        self._mark_config_changed()
         try:
             keys = key_path.split('.')
             config = self.config
@@ -583,10 +902,23 @@ When reviewing text:
             
             # Set the final value
             config[keys[-1]] = value
+            if len(keys) == 2 and keys[0] == "prompts":
+                self._prompt_cache[keys[1]] = value
             
         except Exception as e:
             self.logger.error(f"Error setting config value for {key_path}: {e}")
     
+    def update_settings(self, settings: Dict[str, Any]):
+        """
+        Set several configuration values and save the file once.
+        
+        Args:
+            settings: Mapping of dot-separated key paths to values
+        """
+        for key_path, value in settings.items():
+            self.set(key_path, value)
+        self.save_config()
+    
     def get_api_config(self, provider: Optional[str] = None) -> Dict[str, Any]:
         """
         Get API configuration for the specified provider with secure API key retrieval.
@@ -634,6 +966,9 @@ When reviewing text:
 
         success = self.credential_manager.store_api_key(provider, api_key)
         if success:
+            # The stored providers changed even if the config file does not
+            self._mark_config_changed()
+
             # Clear any API key from config file
             api_config = self.config.get('api', {})
             if provider in api_config and isinstance(api_config[provider], dict):
@@ -664,6 +999,7 @@ When reviewing text:
         Returns:
             True if deleted successfully, False otherwise
         """
+        self._mark_config_changed()
         return self.credential_manager.delete_api_key(provider)
 
     def get_security_status(self) -> Dict[str, Any]:
@@ -673,7 +1009,12 @@ When reviewing text:
         Returns:
             Dictionary with security status details
         """
-        return self.credential_manager.get_security_status()
+        if self._security_cache and self._security_cache[0] == self._config_version:
+            return copy.deepcopy(self._security_cache[1])
+
+        security_status = self.credential_manager.get_security_status()
+        self._security_cache = (self._config_version, security_status)
+        return copy.deepcopy(security_status)
 
     def _validate_and_fix_config(self):
         """Validate configuration and apply automatic fixes where possible."""
@@ -750,6 +1091,9 @@ When reviewing text:
         Returns:
             Dictionary with configuration health information
         """
+        if self._health_cache and self._health_cache[0] == self._config_version:
+            return copy.deepcopy(self._health_cache[1])
+
         validation_result = self.validate_config()
         security_status = self.get_security_status()
 
@@ -769,7 +1113,7 @@ When reviewing text:
         else:
             health_level = 'poor'
 
-        return {
+        report = {
             'health_score': health_score,
             'health_level': health_level,
             'validation': {
@@ -782,31 +1126,19 @@ When reviewing text:
             'recommendations': self._generate_config_recommendations(validation_result, security_status)
         }
 
+        self._health_cache = (self._config_version, report)
+        return copy.deepcopy(report)
+
     def _generate_config_recommendations(self, validation_result: ValidationResult,
                                        security_status: Dict[str, Any]) -> List[str]:
         """Generate configuration recommendations."""
-        recommendations = []
-
-        # Security recommendations
-        if not security_status.get('keyring_available'):
-            recommendations.append("Install keyring library for enhanced API key security")
-
-        if security_status.get('security_level') != 'high':
-            recommendations.append("Consider using environment variables or keyring for API key storage")
-
-        # Performance recommendations
         cache_config = self.config.get('performance', {}).get('cache', {})
-        if cache_config.get('max_memory_mb', 50) < 100:
-            recommendations.append("Consider increasing cache memory limit for better performance")
 
-        # Validation-based recommendations
-        if validation_result.errors:
-            recommendations.append("Fix configuration errors to ensure proper functionality")
-
-        if validation_result.warnings:
-            recommendations.append("Review configuration warnings for optimal performance")
-
-        return recommendations
+        return [
+            message
+            for condition, message in _RECOMMENDATION_RULES
+            if condition(security_status, cache_config, validation_result)
+        ]
 
     def export_config_template(self, include_comments: bool = True) -> str:
         """
@@ -818,37 +1150,9 @@ When reviewing text:
         Returns:
             JSON configuration template as string
         """
-        template = self._get_default_config()
-
         if include_comments:
-            # Add comments to the template (as a separate documentation)
-            comments = {
-                "api": {
-                    "_comment": "API configuration for different providers",
-                    "primary_provider": "The default provider to use",
-                    "deepseek": {
-                        "_comment": "DeepSeek API configuration",
-                        "base_url": "API endpoint URL",
-                        "model": "Model name to use",
-                        "api_key": "API key (use environment variable or keyring for security)"
-                    }
-                },
-                "performance": {
-                    "_comment": "Performance and caching configuration",
-                    "cache": {
-                        "max_size": "Maximum number of cached responses",
-                        "max_memory_mb": "Maximum memory usage for cache in MB",
-                        "ttl": "Time to live for cached responses in seconds"
-                    }
-                }
-            }
-
-            return json.dumps({
-                "config": template,
-                "documentation": comments
-            }, indent=2)
-        else:
-            return json.dumps(template, indent=2)
+            return self._TEMPLATE_JSON_WITH_COMMENTS
+        return self._TEMPLATE_JSON_PLAIN
 
     def reset_to_defaults(self, backup: bool = True) -> bool:
         """
@@ -863,12 +1167,17 @@ When reviewing text:
         try:
             if backup:
                 backup_file = self.config_file.with_suffix('.json.backup')
-                with open(backup_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.config, f, indent=2)
+                if ORJSON_AVAILABLE:
+                    with open(backup_file, 'wb', buffering=64 * 1024) as f:
+                        f.write(orjson.dumps(self.config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+                else:
+                    with open(backup_file, 'w', encoding='utf-8', buffering=64 * 1024) as f:
+                        json.dump(self.config, f, indent=2)
                 self.logger.info(f"Configuration backed up to {backup_file}")
 
-            # Reset to defaults
+            # Reset to defaults; prompts are loaded from their files again
             self.config = self._get_default_config()
+            self._prompt_cache.clear()
             self.save_config()
 
             self.logger.info("Configuration reset to defaults")
@@ -900,7 +1209,7 @@ When reviewing text:
         Returns:
             System prompt string
         """
-        return self.get(f"prompts.{prompt_type}", "")
+        return self._get_prompt(prompt_type)
     
     def update_prompt(self, prompt_type: str, content: str):
         """
@@ -911,4 +1220,5 @@ When reviewing text:
             content: New prompt content
         """
         self.set(f"prompts.{prompt_type}", content)
+        self._prompt_cache[prompt_type] = content
         self._save_prompt(prompt_type, content)
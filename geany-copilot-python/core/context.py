@@ -8,27 +8,36 @@ for better AI assistance in code and writing tasks.
 import os
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Optional, Pattern, Tuple, Any
 from dataclasses import dataclass
 from pathlib import Path
 
 from .language_detector import LanguageDetector, LanguageInfo
 
 
-@dataclass
+@dataclass(frozen=True)
 class FileInfo:
     """Information about the current file."""
+    __slots__ = ('filename', 'extension', 'language', 'encoding', 'line_count', 'is_modified',
+                 'language_confidence')
+
     filename: str
     extension: str
     language: str
     encoding: str
     line_count: int
     is_modified: bool
+    language_confidence: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class CodeContext:
     """Context information for code assistance."""
+    __slots__ = ('selected_text', 'surrounding_text', 'cursor_position', 'line_number',
+                 'column_number', 'function_context', 'class_context', 'imports', 'file_info')
+
     selected_text: str
     surrounding_text: str
     cursor_position: int
@@ -36,13 +45,16 @@ class CodeContext:
     column_number: int
     function_context: Optional[str]
     class_context: Optional[str]
-    imports: List[str]
+    imports: Tuple[str, ...]
     file_info: FileInfo
 
 
-@dataclass
+@dataclass(frozen=True)
 class WritingContext:
     """Context information for writing assistance."""
+    __slots__ = ('selected_text', 'surrounding_text', 'document_type', 'word_count',
+                 'paragraph_count', 'file_info')
+
     selected_text: str
     surrounding_text: str
     document_type: str
@@ -51,6 +63,392 @@ class WritingContext:
     file_info: FileInfo
 
 
+# Language detection patterns, one alternation per language so a buffer
+# is scanned once per language
+_LANGUAGE_PATTERNS = {
+    language: re.compile('|'.join(f'(?:{pattern})' for pattern in patterns))
+    for language, patterns in {
+        'python': [r'def\s+\w+\(', r'class\s+\w+', r'import\s+\w+', r'from\s+\w+\s+import'],
+        'javascript': [r'function\s+\w+\(', r'(?:const|let|var)\s+\w+\s*='],
+        'java': [r'public\s+(?:class\s+\w+|static\s+void\s+main)', r'private\s+\w+'],
+        'c': [r'#include\s*<', r'int\s+main\s*\(', r'void\s+\w+\s*\('],
+        'cpp': [r'#include\s*<', r'class\s+\w+', r'namespace\s+\w+', r'std::'],
+        'html': [r'<(?:html|head>|body>|!DOCTYPE)'],
+        'css': [r'\w+\s*{', r'@(?:media|import)'],
+        'sql': [r'SELECT\s+', r'INSERT\s+INTO', r'CREATE\s+TABLE', r'UPDATE\s+'],
+    }.items()
+}
+
+# Code structure patterns, keyed by language. Parameter lists are bounded
+# to limit backtracking on malformed input. Each language maps to stages of
+# (literal, pattern): a stage's pattern only runs when its literal occurs
+# in the text, and stages are listed in alternative priority order.
+_PYTHON_FUNCTION_PATTERN = re.compile(r'def\s+(\w+)\s*\([^)]{0,500}\):')
+_JS_FUNCTION_DECL_PATTERN = re.compile(r'function\s+(\w+)\s*\(')
+_JS_FUNCTION_PROP_PATTERN = re.compile(r'\b(\w+)\s*:\s*function\s*\(')
+_JS_ARROW_FUNCTION_PATTERN = re.compile(r'\b(\w+)\s*=\s*\([^)]{0,500}\)\s*=>')
+_C_LIKE_FUNCTION_PATTERN = re.compile(r'\b\w+\s+(\w+)\s*\([^)]{0,500}\)\s*{')
+_JS_FUNCTION_STAGES = (
+    ('function', _JS_FUNCTION_DECL_PATTERN),
+    ('function', _JS_FUNCTION_PROP_PATTERN),
+    ('=>', _JS_ARROW_FUNCTION_PATTERN),
+)
+_C_LIKE_FUNCTION_STAGES = (('{', _C_LIKE_FUNCTION_PATTERN),)
+_FUNCTION_PATTERNS = {
+    'python': (('def', _PYTHON_FUNCTION_PATTERN),),
+    'javascript': _JS_FUNCTION_STAGES,
+    'typescript': _JS_FUNCTION_STAGES,
+    'java': _C_LIKE_FUNCTION_STAGES,
+    'c': _C_LIKE_FUNCTION_STAGES,
+    'cpp': _C_LIKE_FUNCTION_STAGES,
+}
+
+_CLASS_PATTERN = re.compile(r'class\s+(\w+)')
+_CLASS_PATTERNS = {
+    language: (('class', _CLASS_PATTERN),)
+    for language in ('python', 'java', 'cpp', 'csharp', 'javascript')
+}
+
+# Import patterns: one alternation per language so the text is scanned
+# once; each alternative captures into its own named group
+_PYTHON_IMPORT_PATTERN = re.compile(
+    r'import\s+(?P<module>\w+(?:\.\w+)*)'
+    r'|from\s+(?P<from_module>\w+(?:\.\w+)*)\s+(?=import)'
+)
+_JS_IMPORT_PATTERN = re.compile(
+    r'import\s+.*?\s+from\s+[\'"](?P<module>[^\'"]+)[\'"]'
+    r'|require\s*\(\s*[\'"](?P<required>[^\'"]+)[\'"]'
+)
+_JAVA_IMPORT_PATTERN = re.compile(r'import\s+(?P<module>[^;]+);')
+_C_INCLUDE_PATTERN = re.compile(r'#include\s*[<"](?P<header>[^>"]+)[>"]')
+_IMPORT_PATTERNS = {
+    'python': _PYTHON_IMPORT_PATTERN,
+    'javascript': _JS_IMPORT_PATTERN,
+    'typescript': _JS_IMPORT_PATTERN,
+    'java': _JAVA_IMPORT_PATTERN,
+    'csharp': _JAVA_IMPORT_PATTERN,
+    'c': _C_INCLUDE_PATTERN,
+    'cpp': _C_INCLUDE_PATTERN,
+}
+
+# Prompt injection and formatting-attack patterns
+_INJECTION_PATTERNS = [
+    re.compile(pattern) for pattern in (
+        r'(?i)ignore\s+previous\s+instructions',
+        r'(?i)forget\s+everything',
+        r'(?i)system\s*:',
+        r'(?i)assistant\s*:',
+        r'(?i)user\s*:',
+        r'(?i)human\s*:',
+        r'(?i)ai\s*:',
+        r'(?i)prompt\s*:',
+        r'(?i)instruction\s*:',
+        r'(?i)override\s+system',
+        r'(?i)new\s+instructions',
+        r'(?i)disregard\s+above',
+        r'(?i)ignore\s+above',
+    )
+]
+_EXCESS_NEWLINES_PATTERN = re.compile(r'\n{4,}')
+_EXCESS_SPACES_PATTERN = re.compile(r' {10,}')
+
+_WORD_PATTERN = re.compile(r'\S+')
+
+
+# Language-specific guidance included in AI prompts
+_LANG_SUGGESTIONS = {
+    'python': (
+        "Follow PEP 8 style guidelines",
+        "Use type hints for better code clarity",
+        "Consider using list comprehensions where appropriate",
+        "Use context managers (with statements) for resource handling",
+        "Follow the principle of least surprise"
+    ),
+    'javascript': (
+        "Use const/let instead of var",
+        "Consider using arrow functions for concise syntax",
+        "Use async/await for asynchronous operations",
+        "Follow consistent naming conventions",
+        "Use strict mode ('use strict')"
+    ),
+    'java': (
+        "Follow Java naming conventions",
+        "Use proper exception handling",
+        "Consider using generics for type safety",
+        "Use StringBuilder for string concatenation in loops",
+        "Follow SOLID principles"
+    ),
+    'c': (
+        "Always check return values of functions",
+        "Use proper memory management (malloc/free)",
+        "Initialize variables before use",
+        "Use const for read-only data",
+        "Avoid buffer overflows"
+    ),
+    'cpp': (
+        "Use RAII (Resource Acquisition Is Initialization)",
+        "Prefer smart pointers over raw pointers",
+        "Use const correctness",
+        "Follow the rule of three/five/zero",
+        "Use STL containers and algorithms"
+    ),
+    'html': (
+        "Use semantic HTML elements",
+        "Include proper DOCTYPE declaration",
+        "Use alt attributes for images",
+        "Ensure proper nesting of elements",
+        "Use meaningful class and id names"
+    ),
+    'css': (
+        "Use consistent naming conventions",
+        "Organize CSS with logical structure",
+        "Use CSS Grid or Flexbox for layouts",
+        "Minimize use of !important",
+        "Consider mobile-first responsive design"
+    )
+}
+_DEFAULT_SUGGESTIONS = (
+    "Write clean, readable code",
+    "Use consistent formatting",
+    "Add appropriate comments"
+)
+
+# Prompt guideline lines: the top three suggestions of each language, pre-joined
+_LANG_GUIDELINE_STRINGS = {
+    language: '; '.join(suggestions[:3])
+    for language, suggestions in _LANG_SUGGESTIONS.items()
+}
+
+_LANG_BEST_PRACTICES = {
+    'python': (
+        "Use virtual environments",
+        "Write docstrings for functions and classes",
+        "Use meaningful variable names",
+        "Keep functions small and focused"
+    ),
+    'javascript': (
+        "Use ESLint for code quality",
+        "Avoid global variables",
+        "Use proper error handling",
+        "Keep functions pure when possible"
+    ),
+    'java': (
+        "Use proper package structure",
+        "Write unit tests",
+        "Use dependency injection",
+        "Follow MVC pattern where appropriate"
+    )
+}
+_DEFAULT_BEST_PRACTICES = (
+    "Write maintainable code",
+    "Use version control",
+    "Test your code",
+    "Document your work"
+)
+
+_LANG_PATTERNS = {
+    'python': (
+        "if __name__ == '__main__':",
+        "with open(filename) as f:",
+        "try/except blocks",
+        "List comprehensions",
+        "Generator expressions"
+    ),
+    'javascript': (
+        "Module imports/exports",
+        "Promise chains",
+        "Event listeners",
+        "Callback functions",
+        "Object destructuring"
+    ),
+    'java': (
+        "try-with-resources",
+        "Builder pattern",
+        "Factory pattern",
+        "Singleton pattern",
+        "Observer pattern"
+    )
+}
+
+
+def _count_words_and_paragraphs(text: str) -> Tuple[int, int]:
+    """
+    Count words and paragraphs of a text.
+
+    Words are runs of non-whitespace; paragraphs are blank-line separated
+    blocks containing non-whitespace, matching str.split() and
+    str.split('\\n\\n') based counting. isspace() checks each block in C
+    without the copy strip() would make.
+    """
+    word_count = sum(1 for _ in _WORD_PATTERN.finditer(text))
+    paragraph_count = sum(
+        1 for paragraph in text.split('\n\n') if paragraph and not paragraph.isspace()
+    )
+
+    return word_count, paragraph_count
+
+
+def _search_scope_name(stages: Tuple[Tuple[str, Pattern[str]], ...], text: str) -> Optional[str]:
+    """
+    Find the first function/class name declared in the tail of a text.
+
+    Each stage's pattern only runs when its literal occurs in the text. The
+    leftmost match wins and earlier stages win ties, as with a single
+    alternation of the stage patterns.
+    """
+    text = text[-_MAX_SCOPE_SCAN_LENGTH:]
+
+    best = None
+    for literal, pattern in stages:
+        if literal not in text:
+            continue
+        match = pattern.search(text)
+        if match and (best is None or match.start() < best.start()):
+            best = match
+
+    return best.group(1) if best else None
+
+
+@lru_cache(maxsize=32)
+def _default_suggestions(language: str) -> Tuple[str, ...]:
+    """Build the generic suggestions for a language without specific guidance."""
+    return (f"Follow {language} best practices",) + _DEFAULT_SUGGESTIONS
+
+
+@lru_cache(maxsize=64)
+def _extension_of(filename: str) -> str:
+    """Get the lowercased extension of a filename ('' for untitled documents)."""
+    return Path(filename).suffix.lower() if filename != "Untitled" else ""
+
+
+# Leading bytes of a document handed to the language detector, which only
+# inspects the shebang line and the first 1000 characters
+_DETECTION_SAMPLE_SIZE = 8192
+
+# Maximum trailing text scanned for the enclosing function/class; only
+# the most recent scope before the cursor matters
+_MAX_SCOPE_SCAN_LENGTH = 8192
+
+# Maximum imports collected per context; prompts only include the first few
+_MAX_IMPORTS = 20
+
+# Literals every import statement of a language contains; text without
+# any of them cannot match that language's import pattern
+_IMPORT_KEYWORDS = {
+    'python': ('import',),
+    'javascript': ('import', 'require'),
+    'typescript': ('import', 'require'),
+    'java': ('import',),
+    'csharp': ('import',),
+    'c': ('#include',),
+    'cpp': ('#include',),
+}
+
+# Document types implied by file extension; these never need content sniffing
+_EXT_TO_DOCTYPE = {
+    '.txt': 'plain_text',
+    '.log': 'plain_text',
+    '.csv': 'plain_text',
+    '.tsv': 'plain_text',
+    '.ini': 'plain_text',
+    '.cfg': 'plain_text',
+    '.conf': 'plain_text',
+    '.md': 'markdown',
+    '.markdown': 'markdown',
+    '.html': 'html',
+    '.htm': 'html',
+    '.tex': 'latex',
+    '.rst': 'restructuredtext',
+}
+
+# Document type content markers, each paired with a character the marker
+# must contain. Checked in priority order; the tag length is bounded to
+# avoid runaway scans on text with unmatched '<'
+_DOCTYPE_CONTENT_PATTERNS = (
+    ('#', re.compile(r'^#+\s+', re.MULTILINE), 'markdown'),
+    ('<', re.compile(r'<[^>]{1,200}>'), 'html'),
+    ('\\', re.compile(r'\\[a-zA-Z]+\{'), 'latex'),
+)
+
+
+@lru_cache(maxsize=256)
+def _detect_document_type_cached(extension: str, text: str) -> str:
+    """Detect a document type from its extension, then its content."""
+    # Check file extension first
+    document_type = _EXT_TO_DOCTYPE.get(extension)
+    if document_type is not None:
+        return document_type
+
+    # Check content patterns, skipping any whose marker character is absent
+    for marker, pattern, document_type in _DOCTYPE_CONTENT_PATTERNS:
+        if marker in text and pattern.search(text):
+            return document_type
+
+    return 'plain_text'
+
+
+@lru_cache(maxsize=64)
+def _format_code_context_cached(context: CodeContext, category: str,
+                                confidence: float, guidelines: str) -> str:
+    """Format code context and its language details for AI."""
+    file_info = context.file_info
+
+    # File information
+    parts = [
+        f"File: {file_info.filename}\n"
+        f"Language: {file_info.language}\n"
+        f"Position: Line {context.line_number}, Column {context.column_number}"
+    ]
+
+    # Enhanced language context
+    parts.append(f"Language Category: {category}")
+    if confidence < 0.8:
+        parts.append(f"Language Detection Confidence: {confidence:.2f}")
+
+    # Code structure context
+    if context.class_context:
+        parts.append(f"Class: {context.class_context}")
+    if context.function_context:
+        parts.append(f"Function: {context.function_context}")
+
+    # Imports
+    if context.imports:
+        parts.append(f"Imports: {', '.join(islice(context.imports, 5))}")  # Limit to first 5
+
+    # Language-specific suggestions
+    if guidelines:
+        parts.append(f"Language Guidelines: {guidelines}")
+
+    # Selected/surrounding text
+    if context.selected_text:
+        parts.append(f"\nSelected code:\n```{file_info.language}\n{context.selected_text}\n```")
+
+    if context.surrounding_text and context.surrounding_text != context.selected_text:
+        parts.append(f"\nSurrounding context:\n```{file_info.language}\n{context.surrounding_text}\n```")
+
+    return "\n".join(parts)
+
+
+@lru_cache(maxsize=64)
+def _format_writing_context_cached(context: WritingContext) -> str:
+    """Format writing context for AI."""
+    # Surrounding context only if different
+    surrounding_text = context.surrounding_text
+    if surrounding_text and surrounding_text != context.selected_text:
+        surrounding_section = f"\n\nSurrounding context:\n{surrounding_text}"
+    else:
+        surrounding_section = ""
+
+    # Document information and selected text
+    return (
+        f"Document: {context.file_info.filename}\n"
+        f"Type: {context.document_type}\n"
+        f"Selected text: {context.word_count} words, {context.paragraph_count} paragraphs\n"
+        f"\nSelected text:\n{context.selected_text}"
+        f"{surrounding_section}"
+    )
+
+
 class ContextAnalyzer:
     """
     Analyzes editor context to provide relevant information for AI assistance.
@@ -58,24 +456,95 @@ class ContextAnalyzer:
     This class extracts and analyzes context from the current editor state,
     including code structure, file information, and surrounding content.
     """
+
+    # Maximum number of code structure analyses kept per analyzer
+    ANALYSIS_CACHE_SIZE = 32
     
     def __init__(self):
         """Initialize the context analyzer."""
         self.logger = logging.getLogger(__name__)
         self.language_detector = LanguageDetector()
-        
+
+        # Recent code structure analyses keyed on (language, text)
+        self._analysis_cache: Dict[Tuple[str, str], Tuple[Optional[str], Optional[str], Tuple[str, ...]]] = {}
+
+        # Language-dependent parts of get_language_context, keyed on language
+        self._language_context_cache: Dict[str, Dict[str, Any]] = {}
+
+        # Geany module reference (None when running outside of Geany)
+        try:
+            import geany
+            self._geany = geany
+        except ImportError:
+            self._geany = None
+
+        # Editor helper module, resolved once instead of on every lookup
+        try:
+            from utils import helpers
+            self._helpers = helpers
+        except ImportError:
+            self._helpers = None
+
         # Language detection patterns
-        self.language_patterns = {
-            'python': [r'def\s+\w+\(', r'class\s+\w+', r'import\s+\w+', r'from\s+\w+\s+import'],
-            'javascript': [r'function\s+\w+\(', r'const\s+\w+\s*=', r'let\s+\w+\s*=', r'var\s+\w+\s*='],
-            'java': [r'public\s+class\s+\w+', r'private\s+\w+', r'public\s+static\s+void\s+main'],
-            'c': [r'#include\s*<', r'int\s+main\s*\(', r'void\s+\w+\s*\('],
-            'cpp': [r'#include\s*<', r'class\s+\w+', r'namespace\s+\w+', r'std::'],
-            'html': [r'<html', r'<head>', r'<body>', r'<!DOCTYPE'],
-            'css': [r'\w+\s*{', r'@media', r'@import'],
-            'sql': [r'SELECT\s+', r'INSERT\s+INTO', r'CREATE\s+TABLE', r'UPDATE\s+'],
-        }
+        self.language_patterns = _LANGUAGE_PATTERNS
     
+    def _get_current_document(self):
+        """Get the current Geany document, or None if unavailable."""
+        if self._helpers is None:
+            return None
+        return self._helpers.get_current_document()
+
+    def _detect_current_language(self, current_doc) -> Tuple[str, LanguageInfo]:
+        """
+        Detect the language of a document.
+
+        LanguageDetector caches its results, so the several lookups made
+        while building one AI request only run detection once.
+
+        Returns:
+            Tuple of (filename, LanguageInfo)
+        """
+        filename = current_doc.file_name or "Untitled"
+
+        # Get Geany's filetype detection
+        geany_filetype = None
+        if hasattr(current_doc, 'file_type') and current_doc.file_type:
+            geany_filetype = current_doc.file_type.name
+
+        # Get the leading part of the document for language detection
+        content = self._get_document_sample(current_doc)
+
+        # Use advanced language detection
+        language_info = self.language_detector.detect_language(
+            filename=filename if filename != "Untitled" else None,
+            content=content,
+            geany_filetype=geany_filetype
+        )
+
+        return filename, language_info
+
+    def _get_document_sample(self, current_doc, limit: int = _DETECTION_SAMPLE_SIZE) -> Optional[str]:
+        """
+        Get the leading part of a document without copying the whole buffer.
+
+        Args:
+            current_doc: Geany document to sample
+            limit: Maximum number of bytes to fetch
+
+        Returns:
+            Document prefix or None if unavailable
+        """
+        try:
+            if not current_doc.editor or not current_doc.editor.scintilla:
+                return None
+
+            scintilla = current_doc.editor.scintilla
+            return scintilla.get_text_range(0, min(scintilla.get_length(), limit))
+
+        except Exception as e:
+            self.logger.error(f"Error getting document sample: {e}")
+            return None
+
     def get_file_info(self) -> Optional[FileInfo]:
         """
         Get information about the current file with enhanced language detection.
@@ -84,29 +553,12 @@ class ContextAnalyzer:
             FileInfo object or None if no file is open
         """
         try:
-            from utils.helpers import get_current_document, get_document_text
-
-            current_doc = get_current_document()
+            current_doc = self._get_current_document()
             if not current_doc:
                 return None
 
-            filename = current_doc.file_name or "Untitled"
-            extension = Path(filename).suffix.lower() if filename != "Untitled" else ""
-
-            # Get Geany's filetype detection
-            geany_filetype = None
-            if hasattr(current_doc, 'file_type') and current_doc.file_type:
-                geany_filetype = current_doc.file_type.name
-
-            # Get document content for language detection
-            content = get_document_text()
-
-            # Use advanced language detection
-            language_info = self.language_detector.detect_language(
-                filename=filename if filename != "Untitled" else None,
-                content=content,
-                geany_filetype=geany_filetype
-            )
+            filename, language_info = self._detect_current_language(current_doc)
+            extension = _extension_of(filename)
 
             encoding = getattr(current_doc, 'encoding', 'utf-8')
             is_modified = getattr(current_doc, 'text_changed', False)
@@ -122,7 +574,8 @@ class ContextAnalyzer:
                 language=language_info.name,
                 encoding=encoding,
                 line_count=line_count,
-                is_modified=is_modified
+                is_modified=is_modified,
+                language_confidence=language_info.confidence
             )
 
         except Exception as e:
@@ -137,59 +590,42 @@ class ContextAnalyzer:
             LanguageInfo object with detection details
         """
         try:
-            from utils.helpers import get_current_document, get_document_text
-
-            current_doc = get_current_document()
+            current_doc = self._get_current_document()
             if not current_doc:
                 return None
 
-            filename = current_doc.file_name or "Untitled"
-
-            # Get Geany's filetype detection
-            geany_filetype = None
-            if hasattr(current_doc, 'file_type') and current_doc.file_type:
-                geany_filetype = current_doc.file_type.name
-
-            # Get document content for language detection
-            content = get_document_text()
-
-            # Use advanced language detection
-            language_info = self.language_detector.detect_language(
-                filename=filename if filename != "Untitled" else None,
-                content=content,
-                geany_filetype=geany_filetype
-            )
-
-            return language_info
+            return self._detect_current_language(current_doc)[1]
 
         except Exception as e:
             self.logger.error(f"Error getting language info: {e}")
             return None
 
-    def get_language_context(self) -> Dict[str, Any]:
+    def get_language_context(self, language_info: Optional[LanguageInfo] = None) -> Dict[str, Any]:
         """
         Get language-specific context for AI prompts.
 
+        Args:
+            language_info: Previously detected language information; detected
+                from the current document when omitted
+
         Returns:
             Dictionary with language context information
         """
         try:
-            language_info = self.get_language_info()
+            if language_info is None:
+                language_info = self.get_language_info()
             if not language_info:
                 return {}
 
             language = language_info.name
-            category = self.language_detector.get_language_category(language)
+            static_context = self._get_static_language_context(language)
 
             context = {
                 'language': language,
-                'category': category,
                 'confidence': language_info.confidence,
                 'features': language_info.features,
-                'suggestions': self._get_language_suggestions(language, category),
-                'best_practices': self._get_language_best_practices(language),
-                'common_patterns': self._get_language_patterns(language)
             }
+            context.update(static_context)
 
             return context
 
@@ -197,124 +633,34 @@ class ContextAnalyzer:
             self.logger.error(f"Error getting language context: {e}")
             return {}
 
-    def _get_language_suggestions(self, language: str, category: str) -> List[str]:
+    def _get_static_language_context(self, language: str) -> Dict[str, Any]:
+        """Get the cached parts of the language context that only depend on the language."""
+        static_context = self._language_context_cache.get(language)
+        if static_context is None:
+            category = self.language_detector.get_language_category(language)
+            static_context = {
+                'category': category,
+                'suggestions': self._get_language_suggestions(language, category),
+                'best_practices': self._get_language_best_practices(language),
+                'common_patterns': self._get_language_patterns(language)
+            }
+            self._language_context_cache[language] = static_context
+        return static_context
+
+    def _get_language_suggestions(self, language: str, category: str) -> Tuple[str, ...]:
         """Get language-specific suggestions for AI assistance."""
-        suggestions = {
-            'python': [
-                "Follow PEP 8 style guidelines",
-                "Use type hints for better code clarity",
-                "Consider using list comprehensions where appropriate",
-                "Use context managers (with statements) for resource handling",
-                "Follow the principle of least surprise"
-            ],
-            'javascript': [
-                "Use const/let instead of var",
-                "Consider using arrow functions for concise syntax",
-                "Use async/await for asynchronous operations",
-                "Follow consistent naming conventions",
-                "Use strict mode ('use strict')"
-            ],
-            'java': [
-                "Follow Java naming conventions",
-                "Use proper exception handling",
-                "Consider using generics for type safety",
-                "Use StringBuilder for string concatenation in loops",
-                "Follow SOLID principles"
-            ],
-            'c': [
-                "Always check return values of functions",
-                "Use proper memory management (malloc/free)",
-                "Initialize variables before use",
-                "Use const for read-only data",
-                "Avoid buffer overflows"
-            ],
-            'cpp': [
-                "Use RAII (Resource Acquisition Is Initialization)",
-                "Prefer smart pointers over raw pointers",
-                "Use const correctness",
-                "Follow the rule of three/five/zero",
-                "Use STL containers and algorithms"
-            ],
-            'html': [
-                "Use semantic HTML elements",
-                "Include proper DOCTYPE declaration",
-                "Use alt attributes for images",
-                "Ensure proper nesting of elements",
-                "Use meaningful class and id names"
-            ],
-            'css': [
-                "Use consistent naming conventions",
-                "Organize CSS with logical structure",
-                "Use CSS Grid or Flexbox for layouts",
-                "Minimize use of !important",
-                "Consider mobile-first responsive design"
-            ]
-        }
-
-        return suggestions.get(language, [
-            f"Follow {language} best practices",
-            "Write clean, readable code",
-            "Use consistent formatting",
-            "Add appropriate comments"
-        ])
-
-    def _get_language_best_practices(self, language: str) -> List[str]:
+        suggestions = _LANG_SUGGESTIONS.get(language)
+        if suggestions is None:
+            suggestions = _default_suggestions(language)
+        return suggestions
+
+    def _get_language_best_practices(self, language: str) -> Tuple[str, ...]:
         """Get language-specific best practices."""
-        practices = {
-            'python': [
-                "Use virtual environments",
-                "Write docstrings for functions and classes",
-                "Use meaningful variable names",
-                "Keep functions small and focused"
-            ],
-            'javascript': [
-                "Use ESLint for code quality",
-                "Avoid global variables",
-                "Use proper error handling",
-                "Keep functions pure when possible"
-            ],
-            'java': [
-                "Use proper package structure",
-                "Write unit tests",
-                "Use dependency injection",
-                "Follow MVC pattern where appropriate"
-            ]
-        }
-
-        return practices.get(language, [
-            "Write maintainable code",
-            "Use version control",
-            "Test your code",
-            "Document your work"
-        ])
-
-    def _get_language_patterns(self, language: str) -> List[str]:
+        return _LANG_BEST_PRACTICES.get(language, _DEFAULT_BEST_PRACTICES)
+
+    def _get_language_patterns(self, language: str) -> Tuple[str, ...]:
         """Get common patterns for the language."""
-        patterns = {
-            'python': [
-                "if __name__ == '__main__':",
-                "with open(filename) as f:",
-                "try/except blocks",
-                "List comprehensions",
-                "Generator expressions"
-            ],
-            'javascript': [
-                "Module imports/exports",
-                "Promise chains",
-                "Event listeners",
-                "Callback functions",
-                "Object destructuring"
-            ],
-            'java': [
-                "try-with-resources",
-                "Builder pattern",
-                "Factory pattern",
-                "Singleton pattern",
-                "Observer pattern"
-            ]
-        }
-
-        return patterns.get(language, [])
+        return _LANG_PATTERNS.get(language, ())
     
     def get_selection_info(self) -> Tuple[str, int, int]:
         """
@@ -324,14 +670,15 @@ class ContextAnalyzer:
             Tuple of (selected_text, start_pos, end_pos)
         """
         try:
-            from utils.helpers import get_selected_text, get_current_document
+            if self._helpers is None:
+                return "", 0, 0
 
-            selected_text = get_selected_text()
+            selected_text = self._helpers.get_selected_text()
             if not selected_text:
                 return "", 0, 0
 
             # Get selection positions
-            current_doc = get_current_document()
+            current_doc = self._get_current_document()
             if not current_doc or not current_doc.editor:
                 return selected_text, 0, 0
 
@@ -359,9 +706,7 @@ class ContextAnalyzer:
             Surrounding text (validated and sanitized)
         """
         try:
-            from utils.helpers import get_current_document
-
-            current_doc = get_current_document()
+            current_doc = self._get_current_document()
             if not current_doc or not current_doc.editor:
                 return ""
 
@@ -386,6 +731,43 @@ class ContextAnalyzer:
             self.logger.error(f"Error getting surrounding text: {e}")
             return ""
     
+    def _gather_editor_state(self) -> Optional[Tuple[Any, int, int, int]]:
+        """
+        Read the editor handle and positions needed for context analysis.
+
+        Returns:
+            Tuple of (scintilla, selection_start, selection_end, length) or
+            None if no editor is available
+        """
+        try:
+            current_doc = self._get_current_document()
+            if not current_doc or not current_doc.editor or not current_doc.editor.scintilla:
+                return None
+
+            scintilla = current_doc.editor.scintilla
+            return (scintilla, scintilla.get_selection_start(),
+                    scintilla.get_selection_end(), scintilla.get_length())
+
+        except Exception as e:
+            self.logger.error(f"Error reading editor state: {e}")
+            return None
+
+    def _slice_window(self, scintilla, window: str, window_start: int, window_end: int,
+                      start: int, end: int) -> str:
+        """
+        Slice a previously fetched text range by Scintilla positions.
+
+        Scintilla positions are UTF-8 byte offsets, so non-ASCII windows are
+        sliced on their encoded form. If the window edges split a multi-byte
+        character the offsets are unreliable and the range is fetched directly.
+        """
+        encoded = window.encode('utf-8')
+        if len(encoded) != window_end - window_start:
+            return scintilla.get_text_range(start, end)
+        if len(encoded) == len(window):
+            return window[start - window_start:end - window_start]
+        return encoded[start - window_start:end - window_start].decode('utf-8', 'replace')
+
     def analyze_code_context(self, context_length: int = 200) -> Optional[CodeContext]:
         """
         Analyze the current code context.
@@ -400,23 +782,58 @@ class ContextAnalyzer:
             file_info = self.get_file_info()
             if not file_info:
                 return None
-            
-            selected_text, start_pos, end_pos = self.get_selection_info()
-            
-            # If no selection, create context around cursor
-            if not selected_text:
-                cursor_pos = self._get_cursor_position()
-                selected_text = self.get_surrounding_text(cursor_pos, context_length // 2)
-                start_pos = cursor_pos - len(selected_text) // 2
-                end_pos = cursor_pos + len(selected_text) // 2
-            
-            surrounding_text = self.get_surrounding_text(start_pos, context_length)
+
+            selected_text, start_pos, surrounding_text = "", 0, ""
+
+            # Read the selection and its surroundings with one text fetch
+            state = self._gather_editor_state()
+            if state is not None:
+                scintilla, selection_start, selection_end, length = state
+                surrounding_length = min(context_length, 10000)
+
+                if selection_start != selection_end:
+                    start_pos = selection_start
+                    window_start = max(0, start_pos - surrounding_length)
+                    window_end = min(length, max(selection_end, start_pos + surrounding_length))
+                    window = scintilla.get_text_range(window_start, window_end)
+
+                    selected_text = self._slice_window(
+                        scintilla, window, window_start, window_end,
+                        selection_start, selection_end
+                    )
+                else:
+                    # No selection: create context around cursor
+                    cursor_pos = self._get_cursor_position()
+                    half_length = min(context_length // 2, 10000)
+                    window_start = max(0, cursor_pos - half_length - surrounding_length)
+                    window_end = min(length, cursor_pos + max(half_length, surrounding_length))
+                    window = scintilla.get_text_range(window_start, window_end)
+
+                    selected_text = self.validate_and_sanitize_context(
+                        self._slice_window(
+                            scintilla, window, window_start, window_end,
+                            max(0, cursor_pos - half_length),
+                            min(length, cursor_pos + half_length)
+                        ),
+                        max_length=20000
+                    )
+                    start_pos = cursor_pos - len(selected_text) // 2
+
+                surrounding_text = self.validate_and_sanitize_context(
+                    self._slice_window(
+                        scintilla, window, window_start, window_end,
+                        max(0, start_pos - surrounding_length),
+                        min(length, start_pos + surrounding_length)
+                    ),
+                    max_length=20000
+                )
+
             line_number, column_number = self._get_cursor_line_column()
             
             # Analyze code structure
-            function_context = self._find_function_context(surrounding_text, file_info.language)
-            class_context = self._find_class_context(surrounding_text, file_info.language)
-            imports = self._extract_imports(surrounding_text, file_info.language)
+            function_context, class_context, imports = self._analyze_code_structure(
+                surrounding_text, file_info.language
+            )
             
             return CodeContext(
                 selected_text=selected_text,
@@ -455,8 +872,7 @@ class ContextAnalyzer:
             
             # Analyze writing characteristics
             document_type = self._detect_document_type(file_info, surrounding_text)
-            word_count = len(selected_text.split())
-            paragraph_count = len([p for p in selected_text.split('\n\n') if p.strip()])
+            word_count, paragraph_count = _count_words_and_paragraphs(selected_text)
             
             return WritingContext(
                 selected_text=selected_text,
@@ -473,10 +889,11 @@ class ContextAnalyzer:
     
     def _get_cursor_position(self) -> int:
         """Get current cursor position."""
+        if self._geany is None:
+            return 0
+
         try:
-            import geany
-            
-            current_doc = geany.document.get_current()
+            current_doc = self._geany.document.get_current()
             if current_doc and current_doc.editor:
                 # Placeholder - would need Scintilla editor access
                 return 0
@@ -488,10 +905,11 @@ class ContextAnalyzer:
     
     def _get_cursor_line_column(self) -> Tuple[int, int]:
         """Get current cursor line and column."""
+        if self._geany is None:
+            return 1, 1
+
         try:
-            import geany
-            
-            current_doc = geany.document.get_current()
+            current_doc = self._geany.document.get_current()
             if current_doc and current_doc.editor:
                 # Placeholder - would need Scintilla editor access
                 return 1, 1
@@ -501,20 +919,36 @@ class ContextAnalyzer:
             self.logger.error(f"Error getting cursor line/column: {e}")
             return 1, 1
     
+    def _analyze_code_structure(self, text: str, language: str) -> Tuple[Optional[str], Optional[str], Tuple[str, ...]]:
+        """
+        Find the function, class and imports in the text, reusing recent results.
+
+        Returns:
+            Tuple of (function_context, class_context, imports)
+        """
+        key = (language, text)
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            return cached
+
+        result = (
+            self._find_function_context(text, language),
+            self._find_class_context(text, language),
+            tuple(self._extract_imports(text, language))
+        )
+
+        # Evict the oldest entry once the cache is full
+        if len(self._analysis_cache) >= self.ANALYSIS_CACHE_SIZE:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+        self._analysis_cache[key] = result
+
+        return result
+
     def _find_function_context(self, text: str, language: str) -> Optional[str]:
         """Find the current function context."""
         try:
-            if language == 'python':
-                match = re.search(r'def\s+(\w+)\s*\([^)]*\):', text)
-                return match.group(1) if match else None
-            elif language in ['javascript', 'typescript']:
-                match = re.search(r'function\s+(\w+)\s*\(|(\w+)\s*:\s*function\s*\(|(\w+)\s*=\s*\([^)]*\)\s*=>', text)
-                return match.group(1) or match.group(2) or match.group(3) if match else None
-            elif language in ['java', 'c', 'cpp']:
-                match = re.search(r'\w+\s+(\w+)\s*\([^)]*\)\s*{', text)
-                return match.group(1) if match else None
-            
-            return None
+            stages = _FUNCTION_PATTERNS.get(language)
+            return _search_scope_name(stages, text) if stages else None
             
         except Exception as e:
             self.logger.error(f"Error finding function context: {e}")
@@ -523,17 +957,8 @@ class ContextAnalyzer:
     def _find_class_context(self, text: str, language: str) -> Optional[str]:
         """Find the current class context."""
         try:
-            if language == 'python':
-                match = re.search(r'class\s+(\w+)', text)
-                return match.group(1) if match else None
-            elif language in ['java', 'cpp', 'csharp']:
-                match = re.search(r'class\s+(\w+)', text)
-                return match.group(1) if match else None
-            elif language == 'javascript':
-                match = re.search(r'class\s+(\w+)', text)
-                return match.group(1) if match else None
-            
-            return None
+            stages = _CLASS_PATTERNS.get(language)
+            return _search_scope_name(stages, text) if stages else None
             
         except Exception as e:
             self.logger.error(f"Error finding class context: {e}")
@@ -542,20 +967,17 @@ class ContextAnalyzer:
     def _extract_imports(self, text: str, language: str) -> List[str]:
         """Extract import statements from the text."""
         try:
-            imports = []
-            
-            if language == 'python':
-                imports.extend(re.findall(r'import\s+(\w+(?:\.\w+)*)', text))
-                imports.extend(re.findall(r'from\s+(\w+(?:\.\w+)*)\s+import', text))
-            elif language in ['javascript', 'typescript']:
-                imports.extend(re.findall(r'import\s+.*?\s+from\s+[\'"]([^\'"]+)[\'"]', text))
-                imports.extend(re.findall(r'require\s*\(\s*[\'"]([^\'"]+)[\'"]', text))
-            elif language in ['java', 'csharp']:
-                imports.extend(re.findall(r'import\s+([^;]+);', text))
-            elif language in ['c', 'cpp']:
-                imports.extend(re.findall(r'#include\s*[<"]([^>"]+)[>"]', text))
-            
-            return imports
+            pattern = _IMPORT_PATTERNS.get(language)
+            if pattern is None:
+                return []
+
+            # Skip the regex scan when no import keyword appears at all
+            if not any(keyword in text for keyword in _IMPORT_KEYWORDS[language]):
+                return []
+
+            # Stop scanning once enough imports are found for the prompt
+            matches = islice(pattern.finditer(text), _MAX_IMPORTS)
+            return [match.group(match.lastgroup) for match in matches]
             
         except Exception as e:
             self.logger.error(f"Error extracting imports: {e}")
@@ -564,27 +986,7 @@ class ContextAnalyzer:
     def _detect_document_type(self, file_info: FileInfo, text: str) -> str:
         """Detect the type of document being edited."""
         try:
-            # Check file extension first
-            if file_info.extension in ['.md', '.markdown']:
-                return 'markdown'
-            elif file_info.extension in ['.txt']:
-                return 'plain_text'
-            elif file_info.extension in ['.html', '.htm']:
-                return 'html'
-            elif file_info.extension in ['.tex']:
-                return 'latex'
-            elif file_info.extension in ['.rst']:
-                return 'restructuredtext'
-            
-            # Check content patterns
-            if re.search(r'^#+\s+', text, re.MULTILINE):
-                return 'markdown'
-            elif re.search(r'<[^>]+>', text):
-                return 'html'
-            elif re.search(r'\\[a-zA-Z]+{', text):
-                return 'latex'
-            
-            return 'plain_text'
+            return _detect_document_type_cached(file_info.extension, text)
             
         except Exception as e:
             self.logger.error(f"Error detecting document type: {e}")
@@ -601,9 +1003,11 @@ class ContextAnalyzer:
             Formatted and validated context string
         """
         try:
-            if isinstance(context, CodeContext):
+            # The context dataclasses are final, so an exact type check suffices
+            context_type = type(context)
+            if context_type is CodeContext:
                 formatted = self._format_code_context(context)
-            elif isinstance(context, WritingContext):
+            elif context_type is WritingContext:
                 formatted = self._format_writing_context(context)
             else:
                 formatted = str(context)
@@ -617,61 +1021,22 @@ class ContextAnalyzer:
     
     def _format_code_context(self, context: CodeContext) -> str:
         """Format code context for AI with enhanced language information."""
-        parts = []
-
-        # File information
-        parts.append(f"File: {context.file_info.filename}")
-        parts.append(f"Language: {context.file_info.language}")
-        parts.append(f"Position: Line {context.line_number}, Column {context.column_number}")
-
-        # Enhanced language context
-        language_context = self.get_language_context()
-        if language_context:
-            parts.append(f"Language Category: {language_context.get('category', 'unknown')}")
-            if language_context.get('confidence', 0) < 0.8:
-                parts.append(f"Language Detection Confidence: {language_context.get('confidence', 0):.2f}")
-
-        # Code structure context
-        if context.class_context:
-            parts.append(f"Class: {context.class_context}")
-        if context.function_context:
-            parts.append(f"Function: {context.function_context}")
-
-        # Imports
-        if context.imports:
-            parts.append(f"Imports: {', '.join(context.imports[:5])}")  # Limit to first 5
-
-        # Language-specific suggestions
-        if language_context and language_context.get('suggestions'):
-            suggestions = language_context['suggestions'][:3]  # Limit to top 3
-            parts.append(f"Language Guidelines: {'; '.join(suggestions)}")
-
-        # Selected/surrounding text
-        if context.selected_text:
-            parts.append(f"\nSelected code:\n```{context.file_info.language}\n{context.selected_text}\n```")
-
-        if context.surrounding_text and context.surrounding_text != context.selected_text:
-            parts.append(f"\nSurrounding context:\n```{context.file_info.language}\n{context.surrounding_text}\n```")
-
-        return "\n".join(parts)
+        # Everything formatted follows from the detection recorded in file_info
+        file_info = context.file_info
+        language = file_info.language
+        static_context = self._get_static_language_context(language)
+
+        guidelines = _LANG_GUIDELINE_STRINGS.get(language)
+        if guidelines is None:
+            guidelines = '; '.join(static_context['suggestions'][:3])
+
+        return _format_code_context_cached(
+            context, static_context['category'], file_info.language_confidence, guidelines
+        )
     
     def _format_writing_context(self, context: WritingContext) -> str:
         """Format writing context for AI."""
-        parts = []
-        
-        # Document information
-        parts.append(f"Document: {context.file_info.filename}")
-        parts.append(f"Type: {context.document_type}")
-        parts.append(f"Selected text: {context.word_count} words, {context.paragraph_count} paragraphs")
-        
-        # Selected text
-        parts.append(f"\nSelected text:\n{context.selected_text}")
-        
-        # Surrounding context if different
-        if context.surrounding_text and context.surrounding_text != context.selected_text:
-            parts.append(f"\nSurrounding context:\n{context.surrounding_text}")
-        
-        return "\n".join(parts)
+        return _format_writing_context_cached(context)
 
     # Security and validation methods
 
@@ -714,30 +1079,14 @@ class ContextAnalyzer:
         sanitized = text
 
         # Remove or escape common prompt injection patterns
-        injection_patterns = [
-            r'(?i)ignore\s+previous\s+instructions',
-            r'(?i)forget\s+everything',
-            r'(?i)system\s*:',
-            r'(?i)assistant\s*:',
-            r'(?i)user\s*:',
-            r'(?i)human\s*:',
-            r'(?i)ai\s*:',
-            r'(?i)prompt\s*:',
-            r'(?i)instruction\s*:',
-            r'(?i)override\s+system',
-            r'(?i)new\s+instructions',
-            r'(?i)disregard\s+above',
-            r'(?i)ignore\s+above',
-        ]
-
-        for pattern in injection_patterns:
-            sanitized = re.sub(pattern, '[FILTERED]', sanitized)
+        for pattern in _INJECTION_PATTERNS:
+            sanitized = pattern.sub('[FILTERED]', sanitized)
 
         # Limit consecutive newlines to prevent formatting attacks
-        sanitized = re.sub(r'\n{4,}', '\n\n\n', sanitized)
+        sanitized = _EXCESS_NEWLINES_PATTERN.sub('\n\n\n', sanitized)
 
         # Remove excessive whitespace
-        sanitized = re.sub(r' {10,}', ' ' * 10, sanitized)
+        sanitized = _EXCESS_SPACES_PATTERN.sub(' ' * 10, sanitized)
 
         return sanitized
 
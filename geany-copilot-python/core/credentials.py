@@ -7,19 +7,49 @@ to environment variables and encrypted file storage.
 """
 
 import os
+import re
+import time
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
 from pathlib import Path
 
-try:
-    import keyring
-    KEYRING_AVAILABLE = True
-except ImportError:
-    KEYRING_AVAILABLE = False
-    keyring = None
+logger = logging.getLogger(__name__)
 
+# keyring is imported on first use: importing it can probe system services,
+# which would otherwise slow down plugin startup
+_keyring = None
+_keyring_probed = False
+_keyring_lock = threading.Lock()
 
-logger = logging.getLogger(__name__)
+
+def _get_keyring():
+    """
+    Import the keyring library on first use.
+
+    Returns:
+        The keyring module, or None if it is not installed
+    """
+    global _keyring, _keyring_probed
+
+    if not _keyring_probed:
+        with _keyring_lock:
+            if not _keyring_probed:
+                try:
+                    import keyring
+                    _keyring = keyring
+                except ImportError:
+                    logger.warning(
+                        "Keyring library not available. API keys will use less secure storage methods. "
+                        "Install 'keyring' package for enhanced security: pip install keyring"
+                    )
+                _keyring_probed = True
+
+    return _keyring
+
+
+# Plausible API key format
+_API_KEY_PATTERN = re.compile(r'[\w.-]{20,}')
 
 
 class CredentialManager:
@@ -34,16 +64,21 @@ class CredentialManager:
     """
     
     SERVICE_NAME = "geany-copilot-python"
+
+    # Seconds an API key lookup is served from memory before asking the keyring again
+    CACHE_TTL = 300.0
     
     def __init__(self):
         """Initialize the credential manager."""
         self.logger = logging.getLogger(__name__)
-        
-        if not KEYRING_AVAILABLE:
-            self.logger.warning(
-                "Keyring library not available. API keys will use less secure storage methods. "
-                "Install 'keyring' package for enhanced security: pip install keyring"
-            )
+
+        # Recent lookups: provider -> (API key or None, lookup time)
+        self._cache: Dict[str, Tuple[Optional[str], float]] = {}
+        self._cache_ttl = self.CACHE_TTL
+        self._lock = threading.RLock()
+
+        # Keyring backend class name, resolved on first status request
+        self._backend_name: Optional[str] = None
     
     def store_api_key(self, provider: str, api_key: str) -> bool:
         """
@@ -63,9 +98,11 @@ class CredentialManager:
         username = f"{provider}_api_key"
         
         # Try to store in OS keyring first
-        if KEYRING_AVAILABLE:
+        keyring = _get_keyring()
+        if keyring is not None:
             try:
                 keyring.set_password(self.SERVICE_NAME, username, api_key)
+                self.clear_cache(provider)
                 self.logger.info(f"API key for {provider} stored securely in OS keyring")
                 return True
             except Exception as e:
@@ -81,6 +118,9 @@ class CredentialManager:
     def get_api_key(self, provider: str) -> Optional[str]:
         """
         Retrieve an API key securely.
+
+        Lookups, including misses, are cached for CACHE_TTL seconds so
+        repeated calls avoid keyring round trips.
         
         Args:
             provider: API provider name (e.g., 'deepseek', 'openai')
@@ -88,10 +128,25 @@ class CredentialManager:
         Returns:
             API key if found, None otherwise
         """
+        with self._lock:
+            cached = self._cache.get(provider)
+            if cached is not None and time.monotonic() - cached[1] <= self._cache_ttl:
+                return cached[0]
+
+        api_key = self._lookup_api_key(provider)
+
+        with self._lock:
+            self._cache[provider] = (api_key, time.monotonic())
+
+        return api_key
+
+    def _lookup_api_key(self, provider: str) -> Optional[str]:
+        """Look up an API key in the keyring, then the environment."""
         username = f"{provider}_api_key"
         
         # 1. Try OS keyring first (most secure)
-        if KEYRING_AVAILABLE:
+        keyring = _get_keyring()
+        if keyring is not None:
             try:
                 api_key = keyring.get_password(self.SERVICE_NAME, username)
                 if api_key:
@@ -123,9 +178,11 @@ class CredentialManager:
         """
         username = f"{provider}_api_key"
         
-        if KEYRING_AVAILABLE:
+        keyring = _get_keyring()
+        if keyring is not None:
             try:
                 keyring.delete_password(self.SERVICE_NAME, username)
+                self.clear_cache(provider)
                 self.logger.info(f"API key for {provider} deleted from OS keyring")
                 return True
             except keyring.errors.PasswordDeleteError:
@@ -138,6 +195,19 @@ class CredentialManager:
         self.logger.warning("Keyring not available, cannot delete stored API key")
         return False
     
+    def clear_cache(self, provider: Optional[str] = None):
+        """
+        Forget cached API key lookups.
+
+        Args:
+            provider: Provider to forget, or None to forget all providers
+        """
+        with self._lock:
+            if provider is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(provider, None)
+    
     def list_stored_providers(self) -> list[str]:
         """
         List providers that have API keys stored.
@@ -170,18 +240,9 @@ class CredentialManager:
         # Remove whitespace
         api_key = api_key.strip()
         
-        # Basic validation - should be at least 20 characters and not contain spaces
-        if len(api_key) < 20:
-            return False
-        
-        if ' ' in api_key:
-            return False
-        
-        # Should contain alphanumeric characters and possibly hyphens/underscores
-        if not all(c.isalnum() or c in '-_.' for c in api_key):
-            return False
-        
-        return True
+        # At least 20 alphanumeric characters, hyphens, underscores or dots;
+        # \w matches exactly str.isalnum() characters plus '_'
+        return _API_KEY_PATTERN.fullmatch(api_key) is not None
     
     def migrate_from_config(self, config_data: Dict[str, Any]) -> bool:
         """
@@ -193,7 +254,7 @@ class CredentialManager:
         Returns:
             True if migration was successful, False otherwise
         """
-        if not KEYRING_AVAILABLE:
+        if _get_keyring() is None:
             self.logger.warning("Cannot migrate to keyring - keyring library not available")
             return False
         
@@ -222,7 +283,7 @@ class CredentialManager:
     
     def is_keyring_available(self) -> bool:
         """Check if OS keyring is available."""
-        return KEYRING_AVAILABLE
+        return _get_keyring() is not None
     
     def get_security_status(self) -> Dict[str, Any]:
         """
@@ -231,9 +292,15 @@ class CredentialManager:
         Returns:
             Dictionary with security status details
         """
+        keyring = _get_keyring()
+
+        # Backend discovery can probe system services, so only do it once
+        if self._backend_name is None and keyring is not None:
+            self._backend_name = keyring.get_keyring().__class__.__name__
+
         return {
-            'keyring_available': KEYRING_AVAILABLE,
-            'keyring_backend': keyring.get_keyring().__class__.__name__ if KEYRING_AVAILABLE else None,
+            'keyring_available': keyring is not None,
+            'keyring_backend': self._backend_name,
             'stored_providers': self.list_stored_providers(),
-            'security_level': 'high' if KEYRING_AVAILABLE else 'medium'
+            'security_level': 'high' if keyring is not None else 'medium'
         }
@@ -6,22 +6,62 @@ file extensions, content analysis, and Geany's filetype detection.
 """
 
 import re
+import sys
 import logging
+import threading
+from collections import OrderedDict
+from operator import attrgetter
 from typing import Optional, Dict, List, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Number of leading characters matched against content patterns
+_CONTENT_SAMPLE_SIZE = 1000
+
+
+def _file_extension(filename: str) -> str:
+    """
+    Get the lowercased extension of a file name without building a Path.
+
+    Follows Path.suffix: only the last path component counts, and a leading
+    or trailing dot does not start an extension. Both '/' and '\\' are
+    treated as separators.
+    """
+    name_start = max(filename.rfind('/'), filename.rfind('\\')) + 1
+    dot = filename.rfind('.')
+    if dot <= name_start or dot == len(filename) - 1:
+        return ''
+    return filename[dot:].lower()
+
+
+def _content_key(content: Optional[str]) -> Optional[str]:
+    """
+    Get the part of the content that language detection depends on.
+
+    Detection only looks at the first line and the content sample, so this
+    is the sample, or the whole first line when it is longer.
+    """
+    if not content:
+        return content
+    sample = content[:_CONTENT_SAMPLE_SIZE]
+    if '\n' in sample:
+        return sample
+    return content.partition('\n')[0]
+
 
 class LanguageInfo:
     """Information about a detected programming language."""
+
+    __slots__ = ('name', 'category', 'confidence', 'features')
     
     def __init__(self, 
                  name: str, 
                  category: str = "programming",
                  confidence: float = 1.0,
                  features: Optional[Dict] = None):
-        self.name = name
+        # Interned so names used as dict keys compare by identity
+        self.name = sys.intern(name)
         self.category = category  # programming, markup, config, data, etc.
         self.confidence = confidence  # 0.0 to 1.0
         self.features = features or {}
@@ -114,95 +154,148 @@ class LanguageDetector:
         '.vimrc': 'vim',
     }
     
-    # Shebang patterns
+    # Shebang interpreters, matched as plain substrings of the first line
     SHEBANG_PATTERNS = {
-        r'#!/usr/bin/env python': 'python',
-        r'#!/usr/bin/python': 'python',
-        r'#!/usr/bin/env node': 'javascript',
-        r'#!/usr/bin/env ruby': 'ruby',
-        r'#!/bin/bash': 'bash',
-        r'#!/bin/sh': 'bash',
-        r'#!/usr/bin/env bash': 'bash',
-        r'#!/usr/bin/perl': 'perl',
-        r'#!/usr/bin/env perl': 'perl',
-        r'#!/usr/bin/php': 'php',
+        '#!/usr/bin/env python': 'python',
+        '#!/usr/bin/python': 'python',
+        '#!/usr/bin/env node': 'javascript',
+        '#!/usr/bin/env ruby': 'ruby',
+        '#!/bin/bash': 'bash',
+        '#!/bin/sh': 'bash',
+        '#!/usr/bin/env bash': 'bash',
+        '#!/usr/bin/perl': 'perl',
+        '#!/usr/bin/env perl': 'perl',
+        '#!/usr/bin/php': 'php',
     }
     
-    # Content patterns for heuristic detection
+    # Content patterns for heuristic detection, compiled once at class creation
     CONTENT_PATTERNS = {
-        'python': [
-            r'import\s+\w+',
-            r'from\s+\w+\s+import',
-            r'def\s+\w+\s*\(',
-            r'class\s+\w+\s*\(',
-            r'if\s+__name__\s*==\s*["\']__main__["\']',
-        ],
-        'javascript': [
-            r'function\s+\w+\s*\(',
-            r'var\s+\w+\s*=',
-            r'let\s+\w+\s*=',
-            r'const\s+\w+\s*=',
-            r'console\.log\s*\(',
-            r'require\s*\(',
-        ],
-        'java': [
-            r'public\s+class\s+\w+',
-            r'public\s+static\s+void\s+main',
-            r'import\s+java\.',
-            r'package\s+\w+',
-        ],
-        'c': [
-            r'#include\s*<\w+\.h>',
-            r'int\s+main\s*\(',
-            r'printf\s*\(',
-            r'malloc\s*\(',
-        ],
-        'cpp': [
-            r'#include\s*<iostream>',
-            r'using\s+namespace\s+std',
-            r'std::\w+',
-            r'cout\s*<<',
-        ],
-        'html': [
-            r'<html\b',
-            r'<head\b',
-            r'<body\b',
-            r'<!DOCTYPE\s+html>',
-        ],
-        'css': [
-            r'\w+\s*\{[^}]*\}',
-            r'@media\s+',
-            r'@import\s+',
-        ],
-        'sql': [
-            r'SELECT\s+.*\s+FROM',
-            r'INSERT\s+INTO',
-            r'UPDATE\s+.*\s+SET',
-            r'CREATE\s+TABLE',
-        ],
+        language: [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
+        for language, patterns in {
+            'python': [
+                r'import\s+\w+',
+                r'from\s+\w+\s+import',
+                r'def\s+\w+\s*\(',
+                r'class\s+\w+\s*\(',
+                r'if\s+__name__\s*==\s*["\']__main__["\']',
+            ],
+            'javascript': [
+                r'function\s+\w+\s*\(',
+                r'var\s+\w+\s*=',
+                r'let\s+\w+\s*=',
+                r'const\s+\w+\s*=',
+                r'console\.log\s*\(',
+                r'require\s*\(',
+            ],
+            'java': [
+                r'public\s+class\s+\w+',
+                r'public\s+static\s+void\s+main',
+                r'import\s+java\.',
+                r'package\s+\w+',
+            ],
+            'c': [
+                r'#include\s*<\w+\.h>',
+                r'int\s+main\s*\(',
+                r'printf\s*\(',
+                r'malloc\s*\(',
+            ],
+            'cpp': [
+                r'#include\s*<iostream>',
+                r'using\s+namespace\s+std',
+                r'std::\w+',
+                r'cout\s*<<',
+            ],
+            'html': [
+                r'<html\b',
+                r'<head\b',
+                r'<body\b',
+                r'<!DOCTYPE\s+html>',
+            ],
+            'css': [
+                r'\b\w+\s*\{[^}]*\}',
+                r'@media\s+',
+                r'@import\s+',
+            ],
+            'sql': [
+                r'SELECT\s+.*\s+FROM',
+                r'INSERT\s+INTO',
+                r'UPDATE\s+.*\s+SET',
+                r'CREATE\s+TABLE',
+            ],
+        }.items()
+    }
+    
+    # Language name to category, flattened from the category lists
+    LANGUAGE_CATEGORIES = {
+        language: category
+        for category, languages in {
+            'programming': [
+                'python', 'javascript', 'typescript', 'java', 'c', 'cpp', 
+                'csharp', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin',
+                'scala', 'perl', 'lua', 'r', 'matlab'
+            ],
+            'shell': ['bash', 'zsh', 'fish', 'powershell', 'batch'],
+            'web': ['html', 'css', 'scss', 'sass', 'less'],
+            'markup': ['markdown', 'restructuredtext', 'latex', 'xml', 'xsl'],
+            'data': ['json', 'yaml', 'toml', 'sql'],
+            'config': ['ini', 'config', 'dockerfile', 'makefile', 'cmake'],
+            'text': ['text', 'vim']
+        }.items()
+        for language in languages
     }
     
+    # Maximum number of detection results remembered
+    DETECTION_CACHE_SIZE = 256
+    
     def __init__(self):
         """Initialize the language detector."""
         self.logger = logger
+
+        # Recent results keyed on (filename, geany_filetype, content key)
+        self._detection_cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
     
     def detect_language(self, 
                        filename: Optional[str] = None,
                        content: Optional[str] = None,
                        geany_filetype: Optional[str] = None) -> LanguageInfo:
         """
-        Detect the programming language using multiple methods.
-        
+        Detect the programming language, reusing recent results.
+
         Args:
             filename: File name or path
             content: File content for analysis
             geany_filetype: Geany's detected filetype
-            
+
         Returns:
             LanguageInfo object with detection results
         """
+        key = (filename, geany_filetype, _content_key(content))
+
+        with self._cache_lock:
+            cached = self._detection_cache.get(key)
+            if cached is not None:
+                self._detection_cache.move_to_end(key)
+                return cached
+
+        result = self._detect_language(filename, content, geany_filetype)
+
+        with self._cache_lock:
+            self._detection_cache[key] = result
+            if len(self._detection_cache) > self.DETECTION_CACHE_SIZE:
+                self._detection_cache.popitem(last=False)
+
+        return result
+
+    def _detect_language(self,
+                         filename: Optional[str],
+                         content: Optional[str],
+                         geany_filetype: Optional[str]) -> LanguageInfo:
+        """Detect the programming language using multiple methods."""
         detections = []
         
+        # Cheap methods run first, roughly in cost order
+        
         # Method 1: Geany filetype (highest priority)
         if geany_filetype:
             detections.append(LanguageInfo(
@@ -211,71 +304,54 @@ class LanguageDetector:
                 features={'source': 'geany_filetype'}
             ))
         
-        # Method 2: File extension
+        # Method 2: Special filename patterns
+        if filename:
+            special_lang = self._detect_by_filename_patterns(filename)
+            if special_lang:
+                detections.append(special_lang)
+        
+        # Method 3: File extension
         if filename:
             ext_lang = self._detect_by_extension(filename)
             if ext_lang:
                 detections.append(ext_lang)
         
-        # Method 3: Content analysis
+        # Method 4: Shebang line
         if content:
-            content_detections = self._detect_by_content(content)
-            detections.extend(content_detections)
+            shebang_lang = self._detect_by_shebang(content)
+            if shebang_lang:
+                detections.append(shebang_lang)
         
-        # Method 4: Special filename patterns
-        if filename:
-            special_lang = self._detect_by_filename_patterns(filename)
-            if special_lang:
-                detections.append(special_lang)
+        # Method 5: Content patterns. Every method above is more confident
+        # than any pattern match can be, so the scan only runs when they
+        # found nothing.
+        if content and not detections:
+            detections.extend(self._detect_by_patterns(content))
         
         # Combine and rank detections
         return self._combine_detections(detections)
     
     def _detect_by_extension(self, filename: str) -> Optional[LanguageInfo]:
         """Detect language by file extension."""
-        try:
-            path = Path(filename)
-            extension = path.suffix.lower()
-            
-            if extension in self.EXTENSION_MAP:
-                language = self.EXTENSION_MAP[extension]
-                return LanguageInfo(
-                    name=language,
-                    confidence=0.8,
-                    features={'source': 'extension', 'extension': extension}
-                )
-        except Exception as e:
-            self.logger.debug(f"Error detecting by extension: {e}")
-        
-        return None
-    
-    def _detect_by_content(self, content: str) -> List[LanguageInfo]:
-        """Detect language by content analysis."""
-        detections = []
-        
-        # Check shebang
-        shebang_lang = self._detect_by_shebang(content)
-        if shebang_lang:
-            detections.append(shebang_lang)
-        
-        # Check content patterns
-        pattern_detections = self._detect_by_patterns(content)
-        detections.extend(pattern_detections)
-        
-        return detections
+        extension = _file_extension(filename)
+        language = self.EXTENSION_MAP.get(extension)
+        if language is None:
+            return None
+
+        return LanguageInfo(
+            name=language,
+            confidence=0.8,
+            features={'source': 'extension', 'extension': extension}
+        )
     
     def _detect_by_shebang(self, content: str) -> Optional[LanguageInfo]:
         """Detect language by shebang line."""
-        lines = content.split('\n')
-        if not lines:
-            return None
-        
-        first_line = lines[0].strip()
+        first_line = content.partition('\n')[0].strip()
         if not first_line.startswith('#!'):
             return None
         
         for pattern, language in self.SHEBANG_PATTERNS.items():
-            if re.search(pattern, first_line):
+            if pattern in first_line:
                 return LanguageInfo(
                     name=language,
                     confidence=0.95,
@@ -288,17 +364,17 @@ class LanguageDetector:
         """Detect language by content patterns."""
         detections = []
         
-        # Sample first 1000 characters for pattern matching
-        sample = content[:1000]
+        # Sample leading characters for pattern matching
+        sample = content[:_CONTENT_SAMPLE_SIZE]
         
         for language, patterns in self.CONTENT_PATTERNS.items():
             matches = 0
             matched_patterns = []
             
             for pattern in patterns:
-                if re.search(pattern, sample, re.IGNORECASE):
+                if pattern.search(sample):
                     matches += 1
-                    matched_patterns.append(pattern)
+                    matched_patterns.append(pattern.pattern)
             
             if matches > 0:
                 confidence = min(0.7, 0.3 + (matches * 0.1))
@@ -343,16 +419,18 @@ class LanguageDetector:
         if not detections:
             return LanguageInfo(name='text', confidence=0.1)
         
-        # Sort by confidence (highest first)
-        detections.sort(key=lambda x: x.confidence, reverse=True)
+        # Highest confidence detection; ties go to the earliest
+        best = max(detections, key=attrgetter('confidence'))
         
-        # Return the highest confidence detection
-        best = detections[0]
-        
-        # Combine features from all detections of the same language
-        combined_features = {}
-        for detection in detections:
-            if detection.name == best.name:
+        # Combine features from all detections of the same language,
+        # merged in descending confidence order
+        same_language = [detection for detection in detections if detection.name == best.name]
+        if len(same_language) == 1:
+            combined_features = best.features
+        else:
+            same_language.sort(key=attrgetter('confidence'), reverse=True)
+            combined_features = {}
+            for detection in same_language:
                 combined_features.update(detection.features)
         
         return LanguageInfo(
@@ -363,22 +441,4 @@ class LanguageDetector:
     
     def get_language_category(self, language: str) -> str:
         """Get the category of a programming language."""
-        categories = {
-            'programming': [
-                'python', 'javascript', 'typescript', 'java', 'c', 'cpp', 
-                'csharp', 'php', 'ruby', 'go', 'rust', 'swift', 'kotlin',
-                'scala', 'perl', 'lua', 'r', 'matlab'
-            ],
-            'shell': ['bash', 'zsh', 'fish', 'powershell', 'batch'],
-            'web': ['html', 'css', 'scss', 'sass', 'less'],
-            'markup': ['markdown', 'restructuredtext', 'latex', 'xml', 'xsl'],
-            'data': ['json', 'yaml', 'toml', 'sql'],
-            'config': ['ini', 'config', 'dockerfile', 'makefile', 'cmake'],
-            'text': ['text', 'vim']
-        }
-        
-        for category, languages in categories.items():
-            if language.lower() in languages:
-                return category
-        
-        return 'other'
+        return self.LANGUAGE_CATEGORIES.get(language.lower(), 'other')
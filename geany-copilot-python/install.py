@@ -13,8 +13,16 @@ import subprocess
 from pathlib import Path
 
 
+# Resolved plugin directory, filled in by the first get_geany_plugin_dir() call
+_PLUGIN_DIR_CACHE = None
+
+
 def get_geany_plugin_dir():
     """Get the Geany plugin directory."""
+    global _PLUGIN_DIR_CACHE
+    if _PLUGIN_DIR_CACHE is not None:
+        return _PLUGIN_DIR_CACHE
+
     # GeanyPy plugins can be installed in several locations
     # Based on official Geany documentation
     possible_dirs = [
@@ -32,12 +40,18 @@ def get_geany_plugin_dir():
     ]
 
     for plugin_dir in possible_dirs:
-        if plugin_dir.exists() and os.access(plugin_dir, os.W_OK):
+        try:
+            os.stat(plugin_dir)
+        except OSError:
+            continue
+        if os.access(plugin_dir, os.W_OK):
+            _PLUGIN_DIR_CACHE = plugin_dir
             return plugin_dir
 
     # Default to the standard user plugin directory
     default_dir = Path.home() / ".config" / "geany" / "plugins"
     default_dir.mkdir(parents=True, exist_ok=True)
+    _PLUGIN_DIR_CACHE = default_dir
     return default_dir
 
 
@@ -115,6 +129,29 @@ def check_geany_requirements():
     return gtk_available
 
 
+# Entries that are never part of an installation
+_SKIP_ENTRIES = frozenset({"__pycache__", ".git", "logs"})
+
+
+def _link_or_copy_tree(source_dir, target_dir):
+    """Recreate source_dir under target_dir, hardlinking files when possible."""
+    os.makedirs(target_dir)
+    with os.scandir(source_dir) as entries:
+        for entry in entries:
+            if entry.name in _SKIP_ENTRIES:
+                continue
+            target = os.path.join(target_dir, entry.name)
+            if entry.is_dir():
+                _link_or_copy_tree(entry.path, target)
+                continue
+            try:
+                # Same filesystem: only a new directory entry is created
+                os.link(entry.path, target)
+            except OSError:
+                # Cross-device (EXDEV) or links unsupported
+                shutil.copy2(entry.path, target)
+
+
 def copy_plugin_files(source_dir, target_dir):
     """Copy plugin files to the target directory."""
     plugin_name = "geany-copilot-python"
@@ -129,7 +166,7 @@ def copy_plugin_files(source_dir, target_dir):
     
     # Copy plugin files
     try:
-        shutil.copytree(source_dir, target_plugin_dir)
+        _link_or_copy_tree(str(source_dir), str(target_plugin_dir))
         print("✅ Plugin files copied successfully")
         return True
     except Exception as e:
@@ -18,9 +18,10 @@ import sys
 import os
 from pathlib import Path
 
-# Add the plugin directory to Python path
-plugin_dir = Path(__file__).parent
-sys.path.insert(0, str(plugin_dir))
+# Add the plugin directory to Python path (once, even if reloaded)
+plugin_dir = str(Path(__file__).parent)
+if plugin_dir not in sys.path:
+    sys.path.insert(0, plugin_dir)
 
 # Import the main plugin class
 try:
@@ -33,8 +34,10 @@ try:
     __plugin_author__ = "Geany Copilot Team"
     __plugin_key_bindings__ = ()
     
-    # Create the plugin instance
-    plugin = GeanyCopilotPlugin()
+    # Create the plugin instance, keeping the existing one on module reload
+    plugin = globals().get('plugin')
+    if plugin is None:
+        plugin = GeanyCopilotPlugin()
     
 except ImportError as e:
     print(f"Failed to load Geany Copilot Python plugin: {e}")
@@ -21,10 +21,19 @@ License: MIT
 import os
 import sys
 import json
+import logging
 import asyncio
+import hashlib
+import html
+import queue
+import signal
+import threading
+import time
+import shutil
 import argparse
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime
 
 # Add the plugin directory to Python path
@@ -32,7 +41,9 @@ plugin_dir = Path(__file__).parent
 sys.path.insert(0, str(plugin_dir))
 
 try:
-    from flask import Flask, request, jsonify, render_template_string
+    from flask import Flask, Response, request, jsonify, stream_with_context
+    from flask import json as flask_json
+    from werkzeug.serving import make_server
     from flask_cors import CORS
     import requests
     FLASK_AVAILABLE = True
@@ -40,15 +51,97 @@ except ImportError:
     print("Flask not available. Install with: pip install flask flask-cors requests")
     FLASK_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None
+
+try:
+    # Pluggable JSON providers exist since Flask 2.2
+    from flask.json.provider import JSONProvider
+except ImportError:
+    JSONProvider = None
+
+if ORJSON_AVAILABLE and JSONProvider is not None:
+    class OrjsonProvider(JSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj: Any, **kwargs: Any) -> str:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+
+        def loads(self, s, **kwargs: Any) -> Any:
+            return orjson.loads(s)
+else:
+    OrjsonProvider = None
+
 from core.config import ConfigManager
 from core.agent import AIAgent
+from core.api_client import APIResponse, create_http_session
+from core.cache import LRUCache
 from agents.code_assistant import CodeAssistant
 from agents.copywriter import CopywriterAssistant
 from utils.logging_setup import setup_plugin_logging
 
+# The log format never shows thread, process or caller details, so skip
+# collecting them for every record in this standalone process
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging._srcfile = None
+
 # Setup logging
 logger = setup_plugin_logging(debug=True)
 
+# Landing page served at '/', filled in once per service with str.format
+INDEX_TEMPLATE = """<!DOCTYPE html>
+<html>
+<head>
+    <title>Geany Copilot Service</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 40px; }}
+        .endpoint {{ background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 5px; }}
+        .method {{ color: #007acc; font-weight: bold; }}
+    </style>
+</head>
+<body>
+    <h1>🚀 Geany Copilot Service</h1>
+    <p>AI-powered code assistance and copywriting service</p>
+    <p><strong>Version:</strong> 2.0.0</p>
+    <p><strong>Status:</strong> Running on {host}:{port}</p>
+
+    <h2>Available Endpoints:</h2>
+
+    <div class="endpoint">
+        <span class="method">POST</span> <code>/api/code-assist</code><br>
+        Get AI-powered code assistance
+    </div>
+
+    <div class="endpoint">
+        <span class="method">POST</span> <code>/api/copywriter</code><br>
+        Get AI-powered copywriting assistance
+    </div>
+
+    <div class="endpoint">
+        <span class="method">GET</span> <code>/api/config</code><br>
+        Get current configuration
+    </div>
+
+    <div class="endpoint">
+        <span class="method">POST</span> <code>/api/config</code><br>
+        Update configuration
+    </div>
+
+    <div class="endpoint">
+        <span class="method">GET</span> <code>/api/health</code><br>
+        Health check endpoint
+    </div>
+</body>
+</html>
+"""
+
+
 class GeanyCopilotService:
     """
     Standalone service for Geany Copilot functionality.
@@ -57,94 +150,215 @@ class GeanyCopilotService:
     allowing integration with Lua plugins or external tools.
     """
     
+    # Lifetime and capacity of cached assistant responses
+    RESPONSE_CACHE_TTL = 300.0
+    RESPONSE_CACHE_SIZE = 1024
+    
+    # Seconds to wait for in-flight requests when shutting down
+    SHUTDOWN_GRACE_PERIOD = 30.0
+    
     def __init__(self, port: int = 8765, host: str = "localhost"):
         self.port = port
         self.host = host
         self.app = None
         
+        # The landing page only depends on host and port, so render it once
+        self._index_html = INDEX_TEMPLATE.format(
+            host=html.escape(str(host)), port=port
+        ).encode('utf-8')
+        
+        # Serialized responses keyed on endpoint and request body, so
+        # repeated submissions skip the LLM call entirely
+        self._response_cache = LRUCache(
+            max_size=self.RESPONSE_CACHE_SIZE,
+            default_ttl=self.RESPONSE_CACHE_TTL
+        )
+        
+        # Serialized GET /api/config body and its ETag, tagged with the
+        # config version they were built from
+        self._config_response: Optional[Tuple[int, bytes, str]] = None
+        
+        # Health check body, rebuilt at most once per second
+        self._health_response: Tuple[int, str] = (0, "")
+        
+        # HTTP server and the number of requests it is still handling
+        self._server = None
+        self._in_flight = 0
+        self._in_flight_cond = threading.Condition()
+        
         # Initialize core components
         self.config_manager = ConfigManager()
-        self.ai_agent = AIAgent(self.config_manager)
+        # One pooled HTTP session keeps LLM connections alive across requests
+        self.http = create_http_session()
+        self.ai_agent = AIAgent(self.config_manager, session=self.http)
         self.code_assistant = CodeAssistant(self.ai_agent, self.config_manager)
         self.copywriter = CopywriterAssistant(self.ai_agent, self.config_manager)
         
         if FLASK_AVAILABLE:
             self.setup_flask_app()
     
+    def _response_cache_key(self, endpoint: str, data: Dict[str, Any]) -> str:
+        """Build a cache key from the endpoint and canonicalized request body."""
+        payload = json.dumps(data, sort_keys=True).encode('utf-8')
+        return f"{endpoint}:{hashlib.blake2b(payload, digest_size=16).hexdigest()}"
+    
+    @staticmethod
+    def _redact_secrets(node: Any) -> Any:
+        """Return a copy of a config tree without *key* or internal (_) entries."""
+        if isinstance(node, dict):
+            return {
+                k: GeanyCopilotService._redact_secrets(v)
+                for k, v in node.items()
+                if 'key' not in k.lower() and not k.startswith('_')
+            }
+        return node
+    
+    def _safe_config(self) -> Dict[str, Any]:
+        """Get the configuration with sensitive values removed."""
+        return self._redact_secrets(self.config_manager.get_all_settings())
+    
+    @staticmethod
+    def _file_context(filename: str, filetype: str) -> str:
+        """Describe the file a request refers to, in the editor context format."""
+        parts = []
+        if filename:
+            parts.append(f"File: {filename}")
+        if filetype:
+            parts.append(f"Language: {filetype}")
+        return "\n".join(parts)
+    
+    @staticmethod
+    def _code_request_text(prompt: str, code: str) -> str:
+        """Combine a code assistance prompt with the code it is about."""
+        if code:
+            return f"{prompt}\n\n```\n{code}\n```"
+        return prompt
+    
+    @contextmanager
+    def _request_conversation(self, agent_type: str, context: str = ""):
+        """
+        Run one service request in a conversation of its own.
+
+        Requests from different clients never share history, and a cached
+        response depends on nothing but the request that produced it.
+        """
+        conversation_id = self.ai_agent.start_conversation(agent_type, context)
+        try:
+            yield conversation_id
+        finally:
+            self.ai_agent.end_conversation(conversation_id)
+    
+    def _request_code_assist(self, request_text: str, file_context: str = "") -> APIResponse:
+        """Get code assistance for a single service request."""
+        with self._request_conversation("code_assistant", file_context) as conversation_id:
+            return self.code_assistant.request_assistance(
+                request_text, conversation_id=conversation_id, context=file_context
+            )
+    
+    def _request_copywriting(self, text: str, prompt: str) -> APIResponse:
+        """Get copywriting assistance for a single service request."""
+        with self._request_conversation("copywriter") as conversation_id:
+            return self.copywriter.request_assistance(
+                f"{prompt}:\n\n{text}", conversation_id=conversation_id, context=""
+            )
+    
+    def _stream_code_assist(self, request_text: str, file_context: str = ""):
+        """
+        Yield code assistance as server-sent events while the LLM produces it.
+
+        The request runs on a worker thread that feeds chunks through a
+        queue, so each one is sent to the client as soon as it arrives. Each
+        stream gets a conversation of its own, so concurrent clients never
+        see one another's turns.
+        """
+        events = queue.Queue()
+
+        def worker():
+            response = None
+            try:
+                with self._request_conversation("code_assistant", file_context) as conversation_id:
+                    response = self.code_assistant.request_streaming_assistance(
+                        request_text,
+                        on_chunk=lambda chunk: events.put(('delta', chunk)),
+                        conversation_id=conversation_id,
+                        context=file_context
+                    )
+            finally:
+                events.put(('done', response))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+        while True:
+            kind, payload = events.get()
+            if kind == 'delta':
+                yield f"data: {flask_json.dumps({'delta': payload})}\n\n"
+                continue
+            if payload is None or not payload.success:
+                error = payload.error if payload is not None else "Streaming failed"
+                yield f"data: {flask_json.dumps({'error': error})}\n\n"
+            yield "data: [DONE]\n\n"
+            return
+    
     def setup_flask_app(self):
         """Setup Flask application with API endpoints."""
         self.app = Flask(__name__)
+        if OrjsonProvider is not None:
+            # Request parsing and every JSON response go through orjson
+            self.app.json = OrjsonProvider(self.app)
         CORS(self.app)  # Enable CORS for cross-origin requests
         
+        @self.app.before_request
+        def track_request_start():
+            with self._in_flight_cond:
+                self._in_flight += 1
+        
+        @self.app.teardown_request
+        def track_request_end(exc):
+            with self._in_flight_cond:
+                self._in_flight -= 1
+                if self._in_flight == 0:
+                    self._in_flight_cond.notify_all()
+        
         @self.app.route('/')
         def index():
-            return render_template_string("""
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>Geany Copilot Service</title>
-                <style>
-                    body { font-family: Arial, sans-serif; margin: 40px; }
-                    .endpoint { background: #f5f5f5; padding: 10px; margin: 10px 0; border-radius: 5px; }
-                    .method { color: #007acc; font-weight: bold; }
-                </style>
-            </head>
-            <body>
-                <h1>🚀 Geany Copilot Service</h1>
-                <p>AI-powered code assistance and copywriting service</p>
-                <p><strong>Version:</strong> 2.0.0</p>
-                <p><strong>Status:</strong> Running on {{ host }}:{{ port }}</p>
-                
-                <h2>Available Endpoints:</h2>
-                
-                <div class="endpoint">
-                    <span class="method">POST</span> <code>/api/code-assist</code><br>
-                    Get AI-powered code assistance
-                </div>
-                
-                <div class="endpoint">
-                    <span class="method">POST</span> <code>/api/copywriter</code><br>
-                    Get AI-powered copywriting assistance
-                </div>
-                
-                <div class="endpoint">
-                    <span class="method">GET</span> <code>/api/config</code><br>
-                    Get current configuration
-                </div>
-                
-                <div class="endpoint">
-                    <span class="method">POST</span> <code>/api/config</code><br>
-                    Update configuration
-                </div>
-                
-                <div class="endpoint">
-                    <span class="method">GET</span> <code>/api/health</code><br>
-                    Health check endpoint
-                </div>
-            </body>
-            </html>
-            """, host=self.host, port=self.port)
+            return Response(self._index_html, mimetype='text/html')
         
         @self.app.route('/api/health')
         def health():
             """Health check endpoint."""
-            return jsonify({
-                "status": "healthy",
-                "service": "geany-copilot",
-                "version": "2.0.0",
-                "timestamp": datetime.now().isoformat()
-            })
+            now = int(time.time())
+            second, body = self._health_response
+            if second != now:
+                body = flask_json.dumps({
+                    "status": "healthy",
+                    "service": "geany-copilot",
+                    "version": "2.0.0",
+                    "timestamp": datetime.fromtimestamp(now).isoformat()
+                })
+                self._health_response = (now, body)
+            return Response(body, mimetype='application/json')
         
         @self.app.route('/api/config', methods=['GET'])
         def get_config():
             """Get current configuration."""
             try:
-                config = self.config_manager.get_all_settings()
-                # Remove sensitive information
-                safe_config = {k: v for k, v in config.items() if 'key' not in k.lower()}
-                return jsonify({"config": safe_config})
+                version = self.config_manager.config_version
+                cached = self._config_response
+                if cached is None or cached[0] != version:
+                    body = flask_json.dumps({"config": self._safe_config()}).encode('utf-8')
+                    cached = (version, body, hashlib.blake2b(body, digest_size=8).hexdigest())
+                    self._config_response = cached
+                
+                _, body, etag = cached
+                if request.if_none_match.contains(etag):
+                    response = Response(status=304)
+                else:
+                    response = Response(body, mimetype='application/json')
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = 'private, max-age=5'
+                return response
             except Exception as e:
-                logger.error(f"Error getting config: {e}")
+                logger.error("Error getting config: %s", e)
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/config', methods=['POST'])
@@ -155,13 +369,12 @@ class GeanyCopilotService:
                 if not data:
                     return jsonify({"error": "No data provided"}), 400
                 
-                # Update configuration
-                for key, value in data.items():
-                    self.config_manager.set_setting(key, value)
+                # Update configuration, writing the file once
+                self.config_manager.update_settings(data)
                 
                 return jsonify({"message": "Configuration updated successfully"})
             except Exception as e:
-                logger.error(f"Error updating config: {e}")
+                logger.error("Error updating config: %s", e)
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/code-assist', methods=['POST'])
@@ -180,24 +393,35 @@ class GeanyCopilotService:
                 if not prompt:
                     return jsonify({"error": "Prompt is required"}), 400
                 
-                # Create context
-                context = {
-                    'filename': filename,
-                    'filetype': filetype,
-                    'selected_text': code,
-                    'prompt': prompt
-                }
+                request_text = self._code_request_text(prompt, code)
+                file_context = self._file_context(filename, filetype)
+                
+                if data.get('stream'):
+                    return Response(
+                        stream_with_context(self._stream_code_assist(request_text, file_context)),
+                        mimetype='text/event-stream'
+                    )
+                
+                cache_key = self._response_cache_key('code-assist', data)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    return Response(cached, mimetype='application/json')
                 
                 # Get response from code assistant
-                response = self.code_assistant.process_request(context)
+                response = self._request_code_assist(request_text, file_context)
+                if not response.success:
+                    return jsonify({"error": response.error}), 500
                 
-                return jsonify({
-                    "response": response,
+                body = flask_json.dumps({
+                    "response": response.content,
                     "timestamp": datetime.now().isoformat()
                 })
+                # Only successful replies are cached, so errors are retried
+                self._response_cache.put(cache_key, body)
+                return Response(body, mimetype='application/json')
                 
             except Exception as e:
-                logger.error(f"Error in code assistance: {e}")
+                logger.error("Error in code assistance: %s", e)
                 return jsonify({"error": str(e)}), 500
         
         @self.app.route('/api/copywriter', methods=['POST'])
@@ -214,22 +438,26 @@ class GeanyCopilotService:
                 if not text:
                     return jsonify({"error": "Text is required"}), 400
                 
-                # Create context
-                context = {
-                    'selected_text': text,
-                    'prompt': prompt
-                }
+                cache_key = self._response_cache_key('copywriter', data)
+                cached = self._response_cache.get(cache_key)
+                if cached is not None:
+                    return Response(cached, mimetype='application/json')
                 
                 # Get response from copywriter
-                response = self.copywriter.process_request(context)
+                response = self._request_copywriting(text, prompt)
+                if not response.success:
+                    return jsonify({"error": response.error}), 500
                 
-                return jsonify({
-                    "response": response,
+                body = flask_json.dumps({
+                    "response": response.content,
                     "timestamp": datetime.now().isoformat()
                 })
+                # Only successful replies are cached, so errors are retried
+                self._response_cache.put(cache_key, body)
+                return Response(body, mimetype='application/json')
                 
             except Exception as e:
-                logger.error(f"Error in copywriting: {e}")
+                logger.error("Error in copywriting: %s", e)
                 return jsonify({"error": str(e)}), 500
     
     def run_flask_service(self):
@@ -238,74 +466,180 @@ class GeanyCopilotService:
             logger.error("Flask is not available. Cannot start HTTP service.")
             return
         
-        logger.info(f"Starting Geany Copilot Service on {self.host}:{self.port}")
-        logger.info(f"Access the service at: http://{self.host}:{self.port}")
+        logger.info("Starting Geany Copilot Service on %s:%s", self.host, self.port)
+        logger.info("Access the service at: http://%s:%s", self.host, self.port)
         
         try:
-            self.app.run(host=self.host, port=self.port, debug=False)
+            # Each request is served on its own thread so slow upstream
+            # LLM calls overlap instead of queueing behind one another
+            self._server = make_server(self.host, self.port, self.app, threaded=True)
         except Exception as e:
-            logger.error(f"Error starting Flask service: {e}")
+            logger.error("Error starting Flask service: %s", e)
+            return
+        
+        signal.signal(signal.SIGTERM, self._handle_shutdown_signal)
+        signal.signal(signal.SIGINT, self._handle_shutdown_signal)
+        
+        # Returns once shutdown() is called; the listening socket is closed
+        # on the way out, so no new connections are accepted while draining
+        self._server.serve_forever()
+        self._drain_requests(self.SHUTDOWN_GRACE_PERIOD)
+        logger.info("Geany Copilot Service stopped")
+    
+    def _handle_shutdown_signal(self, signum, frame):
+        """Stop the HTTP server on SIGTERM/SIGINT."""
+        logger.info("Received signal %s, shutting down", signum)
+        # shutdown() blocks until serve_forever() returns, which cannot
+        # happen while this handler holds the serving thread
+        threading.Thread(target=self._server.shutdown, daemon=True).start()
+    
+    def _drain_requests(self, timeout: float):
+        """Wait up to timeout seconds for in-flight requests to finish."""
+        with self._in_flight_cond:
+            if not self._in_flight_cond.wait_for(lambda: self._in_flight == 0, timeout):
+                logger.warning("Shutting down with %s request(s) still in flight", self._in_flight)
+    
+    def _cli_help(self, args: str):
+        """Show the available CLI commands."""
+        print("""
+Available commands:
+  code <prompt>     - Get code assistance
+  copy <text>       - Get copywriting help
+  config            - Show configuration
+  health            - Show service status
+  help              - Show this help
+  quit              - Exit the service
+                    """)
+    
+    def _cli_code(self, args: str):
+        """Get code assistance for a prompt."""
+        if not args:
+            print("Usage: code <prompt>")
+            return
+        response = self._request_code_assist(args)
+        print(f"\nResponse: {response.content if response.success else response.error}")
+    
+    def _cli_copy(self, args: str):
+        """Get copywriting help for a piece of text."""
+        if not args:
+            print("Usage: copy <text>")
+            return
+        response = self._request_copywriting(args, "Improve this text")
+        print(f"\nResponse: {response.content if response.success else response.error}")
+    
+    def _cli_config(self, args: str):
+        """Show the configuration without sensitive values."""
+        safe_config = self._safe_config()
+        if ORJSON_AVAILABLE:
+            formatted = orjson.dumps(
+                safe_config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            ).decode('utf-8')
+        else:
+            formatted = json.dumps(safe_config, indent=2)
+        print(f"\nConfiguration: {formatted}")
+    
+    def _cli_health(self, args: str):
+        """Show the service status."""
+        print(f"\nService: Geany Copilot v2.0.0")
+        print(f"Status: Running")
+        print(f"Time: {datetime.now().isoformat()}")
     
     def run_cli_mode(self):
         """Run in CLI mode for direct interaction."""
         logger.info("Starting Geany Copilot in CLI mode")
         logger.info("Type 'help' for available commands, 'quit' to exit")
         
+        commands = {
+            'help': self._cli_help,
+            'code': self._cli_code,
+            'copy': self._cli_copy,
+            'config': self._cli_config,
+            'health': self._cli_health,
+        }
+        
         while True:
             try:
                 command = input("\nGeany Copilot> ").strip()
+                verb, _, args = command.partition(' ')
+                verb = verb.lower()
                 
-                if command.lower() in ['quit', 'exit', 'q']:
+                if verb in ('quit', 'exit', 'q'):
                     break
-                elif command.lower() == 'help':
-                    print("""
-Available commands:
-  code <prompt>     - Get code assistance
-  copy <text>       - Get copywriting help
-  config            - Show configuration
-  health            - Show service status
-  help              - Show this help
-  quit              - Exit the service
-                    """)
-                elif command.startswith('code '):
-                    prompt = command[5:]
-                    context = {'prompt': prompt, 'selected_text': ''}
-                    response = self.code_assistant.process_request(context)
-                    print(f"\nResponse: {response}")
-                elif command.startswith('copy '):
-                    text = command[5:]
-                    context = {'selected_text': text, 'prompt': 'Improve this text'}
-                    response = self.copywriter.process_request(context)
-                    print(f"\nResponse: {response}")
-                elif command.lower() == 'config':
-                    config = self.config_manager.get_all_settings()
-                    safe_config = {k: v for k, v in config.items() if 'key' not in k.lower()}
-                    print(f"\nConfiguration: {json.dumps(safe_config, indent=2)}")
-                elif command.lower() == 'health':
-                    print(f"\nService: Geany Copilot v2.0.0")
-                    print(f"Status: Running")
-                    print(f"Time: {datetime.now().isoformat()}")
-                else:
+                
+                handler = commands.get(verb)
+                if handler is None:
                     print("Unknown command. Type 'help' for available commands.")
+                else:
+                    handler(args)
                     
             except KeyboardInterrupt:
                 break
             except Exception as e:
-                logger.error(f"Error processing command: {e}")
+                logger.error("Error processing command: %s", e)
                 print(f"Error: {e}")
         
         logger.info("Geany Copilot CLI mode stopped")
 
 
+def create_app():
+    """Create the Flask application (WSGI entry point for gunicorn)."""
+    return GeanyCopilotService().app
+
+
+def run_gunicorn_service(host: str, port: int, workers: int, worker_class: str,
+                         reuse_port: bool = False):
+    """
+    Replace the current process with gunicorn serving create_app().
+
+    With the gevent worker class gunicorn monkey-patches the standard
+    library itself, so outbound requests calls to the LLM yield to other
+    greenlets while they wait. requests and flask are pure Python and
+    safe to patch.
+
+    gunicorn's master supervises the workers. The app is not preloaded,
+    so each worker imports this module, and sets up its own logging,
+    after it has been forked.
+    """
+    gunicorn = shutil.which("gunicorn")
+    if gunicorn is None:
+        logger.error("gunicorn is not available. Install with: pip install gunicorn gevent")
+        return
+
+    argv = [
+        "gunicorn",
+        "-k", worker_class,
+        "-w", str(workers),
+        "--worker-connections", "1000",
+        "--chdir", str(plugin_dir),
+        "-b", f"{host}:{port}",
+    ]
+    if reuse_port:
+        # Lets several gunicorn instances share the port
+        argv.append("--reuse-port")
+    argv.append("service:create_app()")
+
+    logger.info("Starting Geany Copilot Service under gunicorn on %s:%s", host, port)
+    os.execv(gunicorn, argv)
+
+
 def main():
     """Main entry point for the service."""
     parser = argparse.ArgumentParser(description="Geany Copilot Python Service")
     parser.add_argument('--port', type=int, default=8765, help='Port to run the service on')
     parser.add_argument('--host', type=str, default='localhost', help='Host to bind the service to')
-    parser.add_argument('--mode', choices=['http', 'cli'], default='http', help='Service mode')
+    parser.add_argument('--mode', choices=['http', 'gunicorn', 'cli'], default='http', help='Service mode')
+    parser.add_argument('--workers', type=int, default=2, help='Number of gunicorn worker processes')
+    parser.add_argument('--worker-class', type=str, default='gevent', help='gunicorn worker class')
+    parser.add_argument('--reuse-port', action='store_true',
+                        help='Set SO_REUSEPORT on the gunicorn listener (gunicorn mode)')
     
     args = parser.parse_args()
     
+    if args.mode == 'gunicorn':
+        run_gunicorn_service(args.host, args.port, args.workers, args.worker_class,
+                             reuse_port=args.reuse_port)
+        return
+    
     service = GeanyCopilotService(port=args.port, host=args.host)
     
     if args.mode == 'http':
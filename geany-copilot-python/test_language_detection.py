@@ -13,14 +13,15 @@ from pathlib import Path
 plugin_dir = Path(__file__).parent
 sys.path.insert(0, str(plugin_dir))
 
+from testing_support import get_detector
+
+
 def test_language_detector():
     """Test the LanguageDetector class."""
     print("🧪 Testing LanguageDetector...")
     
     try:
-        from core.language_detector import LanguageDetector, LanguageInfo
-        
-        detector = LanguageDetector()
+        detector = get_detector()
         
         # Test extension detection
         test_cases = [
@@ -114,9 +115,7 @@ def test_language_categories():
     print("\n🧪 Testing language categorization...")
     
     try:
-        from core.language_detector import LanguageDetector
-        
-        detector = LanguageDetector()
+        detector = get_detector()
         
         test_languages = [
             ("python", "programming"),
@@ -148,9 +147,7 @@ def test_shebang_detection():
     print("\n🧪 Testing shebang detection...")
     
     try:
-        from core.language_detector import LanguageDetector
-        
-        detector = LanguageDetector()
+        detector = get_detector()
         
         shebang_tests = [
             ("#!/usr/bin/env python3\nprint('hello')", "python"),
@@ -178,9 +175,7 @@ def test_pattern_matching():
     print("\n🧪 Testing content pattern matching...")
     
     try:
-        from core.language_detector import LanguageDetector
-        
-        detector = LanguageDetector()
+        detector = get_detector()
         
         pattern_tests = [
             ("class MyClass:\n    def __init__(self):\n        pass", "python"),
@@ -201,23 +196,24 @@ def test_pattern_matching():
         return False
 
 
+TESTS = (
+    ("Language Detector", test_language_detector),
+    ("Context Analyzer Language", test_context_analyzer_language),
+    ("Language Categories", test_language_categories),
+    ("Shebang Detection", test_shebang_detection),
+    ("Pattern Matching", test_pattern_matching),
+)
+
+
 def main():
     """Run all language detection tests."""
     print("🚀 Geany Copilot Language Detection Test Suite")
     print("=" * 60)
     
-    tests = [
-        ("Language Detector", test_language_detector),
-        ("Context Analyzer Language", test_context_analyzer_language),
-        ("Language Categories", test_language_categories),
-        ("Shebang Detection", test_shebang_detection),
-        ("Pattern Matching", test_pattern_matching),
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
+    for test_name, test_func in TESTS:
         print(f"\n📋 Running {test_name} test...")
         try:
             if test_func():
@@ -14,6 +14,9 @@ from pathlib import Path
 plugin_dir = Path(__file__).parent
 sys.path.insert(0, str(plugin_dir))
 
+from testing_support import get_config, get_agent
+
+
 def test_imports():
     """Test that all modules can be imported."""
     print("🧪 Testing module imports...")
@@ -67,7 +70,7 @@ def test_configuration():
     try:
         from core.config import ConfigManager
         
-        # Create a temporary config manager
+        # A private instance, so the test value never reaches the shared one
         config = ConfigManager()
         
         # Test basic configuration operations
@@ -101,9 +104,8 @@ def test_api_client():
     
     try:
         from core.api_client import APIClient
-        from core.config import ConfigManager
         
-        config = ConfigManager()
+        config = get_config()
         client = APIClient(config)
         
         if client:
@@ -133,13 +135,11 @@ def test_agents():
     print("\n🧪 Testing agents...")
     
     try:
-        from core.config import ConfigManager
-        from core.agent import AIAgent
         from agents.code_assistant import CodeAssistant
         from agents.copywriter import CopywriterAssistant
         
-        config = ConfigManager()
-        ai_agent = AIAgent(config)
+        config = get_config()
+        ai_agent = get_agent()
         
         # Test code assistant
         code_assistant = CodeAssistant(ai_agent, config)
@@ -211,10 +211,20 @@ def test_plugin_structure():
         "utils/helpers.py",
     ]
     
+    # List each directory once instead of stat'ing every file
+    directory_entries = {}
     missing_files = []
     for file_path in required_files:
-        full_path = plugin_dir / file_path
-        if not full_path.exists():
+        parent, _, name = file_path.rpartition('/')
+        entries = directory_entries.get(parent)
+        if entries is None:
+            try:
+                with os.scandir(plugin_dir / parent) as it:
+                    entries = {entry.name for entry in it}
+            except FileNotFoundError:
+                entries = set()
+            directory_entries[parent] = entries
+        if name not in entries:
             missing_files.append(file_path)
     
     if missing_files:
@@ -226,24 +236,25 @@ def test_plugin_structure():
     return True
 
 
+TESTS = (
+    ("Plugin Structure", test_plugin_structure),
+    ("Module Imports", test_imports),
+    ("Configuration", test_configuration),
+    ("API Client", test_api_client),
+    ("Agents", test_agents),
+    ("Logging", test_logging),
+)
+
+
 def main():
     """Run all tests."""
     print("🚀 Geany Copilot Python Plugin Test Suite")
     print("=" * 50)
     
-    tests = [
-        ("Plugin Structure", test_plugin_structure),
-        ("Module Imports", test_imports),
-        ("Configuration", test_configuration),
-        ("API Client", test_api_client),
-        ("Agents", test_agents),
-        ("Logging", test_logging),
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
+    for test_name, test_func in TESTS:
         print(f"\n📋 Running {test_name} test...")
         try:
             if test_func():
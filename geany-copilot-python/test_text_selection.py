@@ -14,6 +14,7 @@ from pathlib import Path
 plugin_dir = Path(__file__).parent
 sys.path.insert(0, str(plugin_dir))
 
+
 def test_helper_functions():
     """Test the helper functions outside of Geany."""
     print("🧪 Testing helper functions...")
@@ -135,22 +136,23 @@ def test_scintilla_api_usage():
     return True
 
 
+TESTS = (
+    ("Helper Functions", test_helper_functions),
+    ("Context Analyzer", test_context_analyzer),
+    ("Plugin Selection", test_plugin_selection),
+    ("Scintilla API Usage", test_scintilla_api_usage),
+)
+
+
 def main():
     """Run all text selection tests."""
     print("🚀 Geany Copilot Text Selection Test Suite")
     print("=" * 50)
     
-    tests = [
-        ("Helper Functions", test_helper_functions),
-        ("Context Analyzer", test_context_analyzer),
-        ("Plugin Selection", test_plugin_selection),
-        ("Scintilla API Usage", test_scintilla_api_usage),
-    ]
-    
     passed = 0
     failed = 0
     
-    for test_name, test_func in tests:
+    for test_name, test_func in TESTS:
         print(f"\n📋 Running {test_name} test...")
         try:
             if test_func():
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+Shared components for the Geany Copilot test scripts.
+
+Each script creates these at most once, on first use, so its tests do not
+rebuild the configuration and agent stack. The shared agent is cleaned up
+when the script exits.
+"""
+
+import atexit
+
+# Components shared by all tests in a script, created on first use
+_config = None
+_agent = None
+_detector = None
+
+
+def get_config():
+    """Get the shared ConfigManager instance."""
+    global _config
+    if _config is None:
+        from core.config import ConfigManager
+        _config = ConfigManager()
+    return _config
+
+
+def get_agent():
+    """Get the shared AIAgent instance."""
+    global _agent
+    if _agent is None:
+        from core.agent import AIAgent
+        _agent = AIAgent(get_config())
+        atexit.register(_agent.cleanup)
+    return _agent
+
+
+def get_detector():
+    """Get the shared LanguageDetector instance."""
+    global _detector
+    if _detector is None:
+        from core.language_detector import LanguageDetector
+        _detector = LanguageDetector()
+    return _detector